@@ -81,10 +81,15 @@ WSGI_APPLICATION = 'IntelliHub.wsgi.application'
 DATABASE_URL = os.environ.get('DATABASE_URL')
 
 if DATABASE_URL:
-    # Use dj-database-url to parse the DATABASE_URL for production (Postgres on Render)
+    # Use dj-database-url to parse the DATABASE_URL for production (Postgres on Render).
+    # Persistent connections are checked before reuse so a dropped one isn't handed to a request.
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL, conn_max_age=600)
+        'default': dj_database_url.parse(DATABASE_URL, conn_max_age=600, conn_health_checks=True)
     }
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode, where
+    # server-side cursors (used by QuerySet.iterator()) don't survive between transactions.
+    if os.environ.get('DATABASE_TRANSACTION_POOLING', 'False') == 'True':
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
 else:
     # Development default: SQLite
     DATABASES = {
@@ -95,6 +100,21 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# Shared between workers when REDIS_URL is set; otherwise the per-process local-memory default
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -1,50 +1,133 @@
 from django.contrib import admin
+from django.db.models import F
+from django.db.models.functions import Length, Substr
+from django.utils.html import format_html
 from .models import (
     ImageGenerationRequest, GeneratedImage, ImageUpscaleRequest, UserImagePreferences,
     IDEProject, CodeFile, IDEChatMessage, CodeExecutionResult, 
-    ProjectDeployment, ProjectExport, UserIDEPreferences
+    ProjectDeployment, UserIDEPreferences
 )
+from .admin_paginators import NoCountPaginator
 
 # Configure Material admin site titles and branding
 admin.site.site_header = 'IntelliHub Admin'
 admin.site.site_title = 'IntelliHub'
 admin.site.index_title = 'Management Dashboard'
 
+
+def _is_changelist(request):
+    """Whether the admin request is for a changelist; other views display the full row"""
+    match = request.resolver_match
+    return match is not None and (match.url_name or '').endswith('_changelist')
+
+
+class OrientationListFilter(admin.SimpleListFilter):
+    """Filter by image orientation using fixed lookups instead of DISTINCT width/height scans"""
+    title = 'orientation'
+    parameter_name = 'orientation'
+    
+    def lookups(self, request, model_admin):
+        return (
+            ('landscape', 'Landscape'),
+            ('portrait', 'Portrait'),
+            ('square', 'Square'),
+        )
+    
+    def queryset(self, request, queryset):
+        if self.value() == 'landscape':
+            return queryset.filter(width__gt=F('height'))
+        if self.value() == 'portrait':
+            return queryset.filter(width__lt=F('height'))
+        if self.value() == 'square':
+            return queryset.filter(width=F('height'))
+        return queryset
+
 @admin.register(ImageGenerationRequest)
 class ImageGenerationRequestAdmin(admin.ModelAdmin):
     list_display = ('id', 'user', 'prompt_preview', 'status', 'width', 'height', 'created_at', 'generation_time')
-    list_filter = ('status', 'style_preset', 'created_at', 'width', 'height')
+    list_select_related = ('user',)
+    list_filter = ('status', 'style_preset', 'created_at', OrientationListFilter)
     search_fields = ('prompt', 'negative_prompt', 'user__username')
     readonly_fields = ('created_at', 'updated_at', 'generation_time', 'cached')
+    raw_id_fields = ('user',)
     ordering = ('-created_at',)
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        # Only fetch the head and length of the prompt for the preview column
+        return queryset.annotate(
+            _prompt_head=Substr('prompt', 1, 50),
+            _prompt_len=Length('prompt'),
+        ).defer('prompt', 'negative_prompt', 'error_message')
     
     def prompt_preview(self, obj):
-        return obj.prompt[:50] + "..." if len(obj.prompt) > 50 else obj.prompt
+        head = obj._prompt_head or ''
+        return head + "..." if obj._prompt_len > 50 else head
     prompt_preview.short_description = 'Prompt'
 
 @admin.register(GeneratedImage)
 class GeneratedImageAdmin(admin.ModelAdmin):
     list_display = ('id', 'request', 'seed_used', 'file_size', 'favorited', 'public', 'created_at')
+    list_select_related = ('request', 'request__user')
     list_filter = ('favorited', 'public', 'created_at', 'mime_type')
     search_fields = ('request__prompt', 'request__user__username')
-    readonly_fields = ('created_at', 'file_size', 'image_data')
+    readonly_fields = ('created_at', 'file_size', 'image_preview')
+    raw_id_fields = ('request',)
     ordering = ('-created_at',)
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 25
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        return queryset.defer('image_data')
+    
+    def image_preview(self, obj):
+        if obj.pk is None:
+            return '-'
+        return format_html(
+            '<a href="{0}" target="_blank"><img src="{0}" alt="" style="max-width: 256px; max-height: 256px;"></a>',
+            obj.image_url,
+        )
+    image_preview.short_description = 'Image'
 
 @admin.register(ImageUpscaleRequest)
 class ImageUpscaleRequestAdmin(admin.ModelAdmin):
     list_display = ('id', 'user', 'original_image', 'status', 'created_at', 'processing_time')
-    list_filter = ('status', 'created_at')
+    list_select_related = ('user', 'original_image')
+    list_filter = ('status',)
+    date_hierarchy = 'created_at'
     search_fields = ('user__username',)
     readonly_fields = ('created_at', 'processing_time')
+    raw_id_fields = ('user', 'original_image')
     ordering = ('-created_at',)
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        return queryset.defer(
+            'upscaled_image_data', 'error_message', 'original_image__image_data'
+        )
 
 @admin.register(UserImagePreferences)
 class UserImagePreferencesAdmin(admin.ModelAdmin):
     list_display = ('user', 'total_images_generated', 'total_generation_time', 'favorite_style_preset', 'created_at')
+    list_select_related = ('user',)
     list_filter = ('favorite_style_preset', 'created_at')
     search_fields = ('user__username',)
     readonly_fields = ('created_at', 'updated_at', 'total_images_generated', 'total_generation_time')
+    raw_id_fields = ('user',)
     ordering = ('-total_images_generated',)
+    show_full_result_count = False
 
 
 # ============================================================================
@@ -54,10 +137,14 @@ class UserImagePreferencesAdmin(admin.ModelAdmin):
 @admin.register(IDEProject)
 class IDEProjectAdmin(admin.ModelAdmin):
     list_display = ('id', 'name', 'user', 'project_type', 'is_public', 'ai_enabled', 'total_executions', 'created_at', 'updated_at')
-    list_filter = ('project_type', 'is_public', 'ai_enabled', 'is_template', 'created_at')
+    list_select_related = ('user',)
+    list_filter = ('project_type', 'is_public', 'ai_enabled', 'is_template')
+    date_hierarchy = 'created_at'
     search_fields = ('name', 'description', 'user__username')
     readonly_fields = ('created_at', 'updated_at', 'last_accessed', 'total_executions', 'total_ai_queries')
+    raw_id_fields = ('user',)
     ordering = ('-updated_at',)
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
@@ -81,10 +168,16 @@ class IDEProjectAdmin(admin.ModelAdmin):
 @admin.register(CodeFile)
 class CodeFileAdmin(admin.ModelAdmin):
     list_display = ('id', 'name', 'path', 'project', 'file_type', 'size_bytes', 'line_count', 'updated_at')
-    list_filter = ('file_type', 'ai_generated', 'created_at', 'updated_at')
-    search_fields = ('name', 'path', 'project__name', 'content')
+    list_select_related = ('project', 'project__user')
+    list_filter = ('file_type', 'ai_generated')
+    date_hierarchy = 'updated_at'
+    search_fields = ('name', 'path', 'project__name')
     readonly_fields = ('created_at', 'updated_at', 'size_bytes', 'line_count', 'version')
+    raw_id_fields = ('project', 'previous_version')
     ordering = ('-updated_at',)
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 25
     
     fieldsets = (
         ('File Information', {
@@ -103,28 +196,55 @@ class CodeFileAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at')
         }),
     )
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        return queryset.defer('content')
 
 
 @admin.register(IDEChatMessage)
 class IDEChatMessageAdmin(admin.ModelAdmin):
     list_display = ('id', 'project', 'role', 'message_preview', 'message_type', 'model_used', 'created_at')
+    list_select_related = ('project', 'project__user')
     list_filter = ('role', 'message_type', 'created_at')
     search_fields = ('content', 'project__name')
     readonly_fields = ('created_at', 'response_time', 'tokens_used')
+    raw_id_fields = ('project', 'context_files')
     ordering = ('-created_at',)
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        # Only fetch the head and length of the content for the preview column
+        return queryset.annotate(
+            _content_head=Substr('content', 1, 100),
+            _content_len=Length('content'),
+        ).defer('content', 'code_snippets')
     
     def message_preview(self, obj):
-        return obj.content[:100] + "..." if len(obj.content) > 100 else obj.content
+        head = obj._content_head or ''
+        return head + "..." if obj._content_len > 100 else head
     message_preview.short_description = 'Message'
 
 
 @admin.register(CodeExecutionResult)
 class CodeExecutionResultAdmin(admin.ModelAdmin):
     list_display = ('id', 'project', 'user', 'execution_type', 'status', 'exit_code', 'execution_time', 'created_at')
+    list_select_related = ('project', 'project__user', 'user')
     list_filter = ('status', 'execution_type', 'created_at')
-    search_fields = ('project__name', 'user__username', 'code')
+    search_fields = ('project__name', 'user__username')
     readonly_fields = ('created_at', 'started_at', 'completed_at', 'execution_time', 'memory_used', 'cpu_time')
+    raw_id_fields = ('project', 'user', 'file')
     ordering = ('-created_at',)
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    list_per_page = 25
+    list_max_show_all = 25
     
     fieldsets = (
         ('Execution Details', {
@@ -146,33 +266,43 @@ class CodeExecutionResultAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'started_at', 'completed_at')
         }),
     )
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        return queryset.defer('code', 'stdout', 'stderr')
 
 
 @admin.register(ProjectDeployment)
 class ProjectDeploymentAdmin(admin.ModelAdmin):
     list_display = ('id', 'project', 'user', 'platform', 'status', 'deployment_url', 'created_at', 'deployed_at')
-    list_filter = ('platform', 'status', 'created_at')
+    list_select_related = ('project', 'project__user', 'user')
+    list_filter = ('platform', 'status')
+    date_hierarchy = 'created_at'
     search_fields = ('project__name', 'user__username', 'deployment_url', 'repository_url')
     readonly_fields = ('created_at', 'deployed_at')
+    raw_id_fields = ('project', 'user')
     ordering = ('-created_at',)
-
-
-@admin.register(ProjectExport)
-class ProjectExportAdmin(admin.ModelAdmin):
-    list_display = ('id', 'project', 'user', 'export_format', 'status', 'file_size', 'created_at', 'expires_at')
-    list_filter = ('export_format', 'status', 'created_at')
-    search_fields = ('project__name', 'user__username')
-    readonly_fields = ('created_at', 'file_size')
-    ordering = ('-created_at',)
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        return queryset.defer('config', 'deployment_log', 'error_message')
 
 
 @admin.register(UserIDEPreferences)
 class UserIDEPreferencesAdmin(admin.ModelAdmin):
     list_display = ('user', 'theme', 'font_size', 'total_projects', 'total_executions', 'total_ai_queries', 'updated_at')
+    list_select_related = ('user',)
     list_filter = ('theme', 'ai_autocomplete', 'ai_suggestions', 'auto_save', 'created_at')
     search_fields = ('user__username',)
     readonly_fields = ('created_at', 'updated_at', 'total_projects', 'total_executions', 'total_ai_queries')
+    raw_id_fields = ('user',)
     ordering = ('-updated_at',)
+    show_full_result_count = False
     
     fieldsets = (
         ('User', {
@@ -0,0 +1,34 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class NoCountPaginator(Paginator):
+    """Paginator that avoids SELECT COUNT(*) on large unfiltered admin changelists.
+
+    On PostgreSQL the row count of an unfiltered queryset is estimated from
+    pg_class.reltuples. Filtered querysets and other backends fall back to
+    the real count.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE relname = %s",
+                [query.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 (or 0) until the table has been analyzed
+        if not row or row[0] <= 0:
+            return super().count
+        return int(row[0])
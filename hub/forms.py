@@ -1,9 +1,187 @@
+from functools import lru_cache, wraps
+from types import MappingProxyType
+import time
+
 from django import forms
 from django.contrib.auth.models import User
-from .models import ImageGenerationRequest, VideoGenerationRequest, AudioGenerationRequest
-from .services.stable_diffusion import get_available_style_presets
-from .services.video_generation import get_available_video_models
-from .services.audio_generation import get_available_voices
+from .models import (
+    ImageGenerationRequest, VideoGenerationRequest, AudioGenerationRequest,
+    PresentationProject, PresentationSlide,
+)
+
+
+# Shared Tailwind classes for text inputs, textareas, selects and number inputs
+INPUT_CLASS = "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
+
+# Read-only so it can be shared by every widget; Widget.__init__ copies attrs
+_INPUT_ATTRS = MappingProxyType({"class": INPUT_CLASS})
+
+CHECKBOX_CLASS = "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
+
+_CHECKBOX_ATTRS = MappingProxyType({"class": CHECKBOX_CLASS})
+
+
+def _input_attrs(**extra):
+    """Input widget attrs with the shared class plus any extra attributes"""
+    return {"class": INPUT_CLASS, **extra}
+
+
+def _textarea_attrs(rows, placeholder=None, **extra):
+    """Textarea widget attrs with the shared class"""
+    attrs = {"rows": rows}
+    if placeholder is not None:
+        attrs["placeholder"] = placeholder
+    attrs["class"] = INPUT_CLASS
+    attrs.update(extra)
+    return attrs
+
+
+class StaticChoiceField(forms.ChoiceField):
+    """ChoiceField for a flat, static choice list, validated with a dict lookup.
+    
+    Cleaned values are the choice keys themselves, so they share the
+    module's constant strings rather than the copies parsed from the request.
+    The lookup is built once from the choices passed in, so they must not be
+    reassigned afterwards.
+    """
+
+    def __init__(self, *, choices, **kwargs):
+        super().__init__(choices=choices, **kwargs)
+        self._valid_values = {str(key): key for key, _ in choices}
+
+    def valid_value(self, value):
+        return str(value) in self._valid_values
+
+    def clean(self, value):
+        value = super().clean(value)
+        return self._valid_values.get(value, value)
+
+
+# Static choice lists shared by the form classes below
+QUICK_IMAGE_STYLES = (
+    ('', 'Default'),
+    ('photographic', 'Photographic'),
+    ('digital-art', 'Digital Art'),
+    ('anime', 'Anime'),
+    ('fantasy-art', 'Fantasy'),
+    ('cinematic', 'Cinematic'),
+)
+
+UPSCALE_FACTOR_CHOICES = (
+    ('2x', '2x Upscale'),
+    ('4x', '4x Upscale (Premium)'),
+)
+
+QUICK_AUDIO_VOICES = (
+    ('alloy', 'Alloy (Neutral)'),
+    ('echo', 'Echo (Professional)'),
+    ('fable', 'Fable (Storytelling)'),
+    ('onyx', 'Onyx (Deep)'),
+)
+
+TTS_MODEL_CHOICES = (
+    ('microsoft/speecht5_tts', 'Microsoft SpeechT5 (Recommended)'),
+    ('facebook/mms-tts-eng', 'Facebook MMS TTS'),
+    ('espnet/kan-bayashi_ljspeech_vits', 'VITS TTS'),
+    ('suno/bark', 'Bark TTS'),
+    ('tts-1', 'TTS-1 (Fallback)'),
+)
+
+QUICK_PRESENTATION_TYPE_CHOICES = (
+    ('business', 'Business'),
+    ('educational', 'Educational'),
+    ('marketing', 'Marketing'),
+    ('other', 'Other'),
+)
+
+EXPORT_FORMAT_CHOICES = (
+    ('pdf', 'PDF Document'),
+    ('pptx', 'PowerPoint (.pptx)'),
+    ('html', 'HTML Presentation'),
+    ('images', 'Image Files (ZIP)'),
+    ('json', 'JSON Data'),
+)
+
+# Same lists as the model fields these forms fill in
+PRESENTATION_TYPE_CHOICES = PresentationProject.PRESENTATION_TYPE_CHOICES
+PRESENTATION_THEMES = PresentationProject.THEME_CHOICES
+PRESENTATION_COLOR_SCHEMES = PresentationProject.COLOR_SCHEME_CHOICES
+PRESENTATION_TONES = PresentationProject.TONE_CHOICES
+SLIDE_TYPE_CHOICES = PresentationSlide.SLIDE_TYPE_CHOICES
+SLIDE_LAYOUT_CHOICES = PresentationSlide.LAYOUT_CHOICES
+
+# Used when the video model / voice lookups fail (the video service raising gets only the first entry)
+_VIDEO_MODEL_FALLBACK = (
+    ('ali-vilab/text-to-video-ms-1.7b', 'Alibaba Text-to-Video (Default)'),
+    ('damo-vilab/text-to-video-ms-1.7b', 'DAMO Text-to-Video'),
+)
+
+_VOICE_FALLBACK = (
+    ('', 'Default'),
+    ('alloy', 'Alloy'),
+    ('echo', 'Echo'),
+    ('fable', 'Fable'),
+    ('onyx', 'Onyx'),
+    ('nova', 'Nova'),
+    ('shimmer', 'Shimmer'),
+)
+
+
+# Service-backed choices are rebuilt after this many seconds, so a failed lookup is retried
+SERVICE_CHOICES_TTL = 300
+
+
+def _ttl_cached(func):
+    """Cache a no-argument choices builder for SERVICE_CHOICES_TTL seconds"""
+    cached = {}
+
+    @wraps(func)
+    def wrapper():
+        now = time.monotonic()
+        # One (value, built_at) tuple, so a concurrent reader or cache_clear() never sees half an entry
+        entry = cached.get('entry')
+        if entry is None or now - entry[1] >= SERVICE_CHOICES_TTL:
+            entry = cached['entry'] = (func(), now)
+        return entry[0]
+
+    wrapper.cache_clear = cached.clear
+    return wrapper
+
+
+@lru_cache(maxsize=1)
+def _style_preset_choices():
+    """Style preset choices, built once per process"""
+    # Service modules are imported on first use to keep them off the import path
+    from .services.stable_diffusion import get_available_style_presets
+    return [('', 'No Style (Default)')] + [
+        (preset, preset.replace('-', ' ').title())
+        for preset in get_available_style_presets()
+    ]
+
+
+@_ttl_cached
+def _video_model_choices():
+    """Video model choices, cached for SERVICE_CHOICES_TTL (fallback if the service lookup failed)"""
+    try:
+        from .services.video_generation import get_available_video_models
+        return [(model['id'], model['name']) for model in get_available_video_models()] or _VIDEO_MODEL_FALLBACK
+    except Exception:
+        return _VIDEO_MODEL_FALLBACK[:1]
+
+
+def _default_video_model():
+    """Initial video model: the first available choice"""
+    return _video_model_choices()[0][0]
+
+
+@_ttl_cached
+def _voice_choices():
+    """Voice choices, cached for SERVICE_CHOICES_TTL (fallback if the service lookup failed)"""
+    try:
+        from .services.audio_generation import get_available_voices
+        return [('', 'Default')] + [(voice['id'], voice['name']) for voice in get_available_voices()]
+    except Exception:
+        return _VOICE_FALLBACK
 
 
 class SignUpForm(forms.ModelForm):
@@ -27,28 +205,20 @@ class ImageGenerationForm(forms.Form):
     """Form for image generation requests"""
     
     prompt = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 4,
-            "placeholder": "Describe the image you want to generate...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(4, "Describe the image you want to generate...")),
         label="Image Prompt",
         help_text="Describe what you want to see in the image"
     )
     
     negative_prompt = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 2,
-            "placeholder": "Things to avoid in the image (optional)...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(2, "Things to avoid in the image (optional)...")),
         label="Negative Prompt",
         required=False,
         help_text="Specify what you don't want in the image"
     )
     
     # Size options
-    SIZE_CHOICES = [
+    SIZE_CHOICES = (
         ('1024x1024', 'Square (1024×1024)'),
         ('1152x896', 'Landscape (1152×896)'),
         ('896x1152', 'Portrait (896×1152)'),
@@ -58,23 +228,23 @@ class ImageGenerationForm(forms.Form):
         ('768x1344', 'Ultra Tall (768×1344)'),
         ('1536x640', 'Panoramic (1536×640)'),
         ('640x1536', 'Tall Panoramic (640×1536)'),
-    ]
+    )
+    # (width, height) for each size, parsed once instead of on every clean()
+    SIZE_MAP = {size: tuple(map(int, size.split('x'))) for size, _ in SIZE_CHOICES}
     
     size = forms.ChoiceField(
         choices=SIZE_CHOICES,
         initial='1024x1024',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Image Size"
     )
     
     # Style preset
+    # Callable choices are only evaluated when the field is rendered or validated
     style_preset = forms.ChoiceField(
+        choices=_style_preset_choices,
         required=False,
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Style Preset",
         help_text="Choose a style to apply to your image"
     )
@@ -84,11 +254,7 @@ class ImageGenerationForm(forms.Form):
         initial=30,
         min_value=10,
         max_value=50,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "min": 10,
-            "max": 50
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(min=10, max=50)),
         label="Steps",
         help_text="Number of diffusion steps (10-50, higher = better quality but slower)"
     )
@@ -97,12 +263,7 @@ class ImageGenerationForm(forms.Form):
         initial=7.0,
         min_value=1.0,
         max_value=35.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "min": 1.0,
-            "max": 35.0,
-            "step": 0.5
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(min=1.0, max=35.0, step=0.5)),
         label="CFG Scale",
         help_text="How closely to follow the prompt (1-35, 7 is recommended)"
     )
@@ -111,47 +272,25 @@ class ImageGenerationForm(forms.Form):
         initial=1,
         min_value=1,
         max_value=4,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "min": 1,
-            "max": 4
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(min=1, max=4)),
         label="Number of Images",
         help_text="How many images to generate (1-4)"
     )
     
     seed = forms.IntegerField(
         required=False,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "placeholder": "Random (leave empty for random)"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(placeholder="Random (leave empty for random)")),
         label="Seed",
         help_text="Random seed for reproducible results (optional)"
     )
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Populate style preset choices
-        style_choices = [('', 'No Style (Default)')] + [
-            (preset, preset.replace('-', ' ').title()) 
-            for preset in get_available_style_presets()
-        ]
-        self.fields['style_preset'].choices = style_choices
-    
     def clean(self):
         cleaned_data = super().clean()
         
-        # Parse size
+        # size only reaches cleaned_data once ChoiceField has validated it
         size = cleaned_data.get('size')
         if size:
-            try:
-                width, height = map(int, size.split('x'))
-                cleaned_data['width'] = width
-                cleaned_data['height'] = height
-            except ValueError:
-                raise forms.ValidationError("Invalid size format")
+            cleaned_data['width'], cleaned_data['height'] = self.SIZE_MAP[size]
         
         return cleaned_data
 
@@ -160,28 +299,15 @@ class QuickImageForm(forms.Form):
     """Simplified form for quick image generation"""
     
     prompt = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 3,
-            "placeholder": "Describe your image...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(3, "Describe your image...")),
         label="Prompt",
         max_length=1000
     )
     
     style = forms.ChoiceField(
-        choices=[
-            ('', 'Default'),
-            ('photographic', 'Photographic'),
-            ('digital-art', 'Digital Art'),
-            ('anime', 'Anime'),
-            ('fantasy-art', 'Fantasy'),
-            ('cinematic', 'Cinematic'),
-        ],
+        choices=QUICK_IMAGE_STYLES,
         required=False,
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Style"
     )
 
@@ -192,14 +318,9 @@ class ImageUpscaleForm(forms.Form):
     image_id = forms.IntegerField(widget=forms.HiddenInput())
     
     target_size = forms.ChoiceField(
-        choices=[
-            ('2x', '2x Upscale'),
-            ('4x', '4x Upscale (Premium)'),
-        ],
+        choices=UPSCALE_FACTOR_CHOICES,
         initial='2x',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Upscale Factor"
     )
 
@@ -208,11 +329,7 @@ class VideoGenerationForm(forms.Form):
     """Form for video generation requests"""
     
     prompt = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 4,
-            "placeholder": "Describe the video you want to generate...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(4, "Describe the video you want to generate...")),
         label="Video Prompt",
         max_length=500,  # Add max length for better UX
         help_text="Describe what you want to see in the video (max 500 characters)"
@@ -220,28 +337,27 @@ class VideoGenerationForm(forms.Form):
     
     # Model selection - Dynamic based on available models
     model = forms.ChoiceField(
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        choices=_video_model_choices,
+        initial=_default_video_model,
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Video Model",
         help_text="Choose the AI model for video generation"
     )
     
     # Video dimensions
-    SIZE_CHOICES = [
+    SIZE_CHOICES = (
         ('', 'Default (Model-specific)'),
         ('512x512', 'Square (512×512)'),
         ('640x480', 'Standard (640×480)'),
         ('720x480', 'SD Wide (720×480)'),
         ('1280x720', 'HD (1280×720)'),
-    ]
+    )
+    SIZE_MAP = {size: tuple(map(int, size.split('x'))) for size, _ in SIZE_CHOICES if size}
     
     size = forms.ChoiceField(
         choices=SIZE_CHOICES,
         required=False,
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Video Size",
         help_text="Choose video dimensions (leave default for model-specific sizing)"
     )
@@ -251,13 +367,7 @@ class VideoGenerationForm(forms.Form):
         required=False,
         min_value=1.0,
         max_value=10.0,  # Reduced max for better performance
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "placeholder": "e.g., 3.0",
-            "step": "0.5",
-            "min": "1.0",
-            "max": "10.0"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(placeholder="e.g., 3.0", step="0.5", min="1.0", max="10.0")),
         label="Duration (seconds)",
         help_text="Video duration in seconds (1-10, leave empty for model default)"
     )
@@ -267,57 +377,25 @@ class VideoGenerationForm(forms.Form):
         required=False,
         min_value=8,
         max_value=30,  # Reduced max for better performance
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "placeholder": "e.g., 24",
-            "min": "8",
-            "max": "30"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(placeholder="e.g., 24", min="8", max="30")),
         label="FPS (Frames per second)",
         help_text="Video frame rate (8-30, leave empty for model default)"
     )
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Dynamically load available models
-        try:
-            models = get_available_video_models()
-            if models:
-                self.fields['model'].choices = [(model['id'], model['name']) for model in models]
-                if models:
-                    self.fields['model'].initial = models[0]['id']
-            else:
-                # Fallback choices if service is unavailable
-                self.fields['model'].choices = [
-                    ('ali-vilab/text-to-video-ms-1.7b', 'Alibaba Text-to-Video (Default)'),
-                    ('damo-vilab/text-to-video-ms-1.7b', 'DAMO Text-to-Video'),
-                ]
-        except Exception:
-            # Fallback if service call fails
-            self.fields['model'].choices = [
-                ('ali-vilab/text-to-video-ms-1.7b', 'Alibaba Text-to-Video (Default)'),
-            ]
-    
     def clean_prompt(self):
-        prompt = self.cleaned_data.get('prompt', '').strip()
-        if not prompt:
-            raise forms.ValidationError("Prompt cannot be empty")
-        if len(prompt) < 10:
-            raise forms.ValidationError("Prompt must be at least 10 characters long")
+        if len(prompt := (self.cleaned_data.get('prompt') or '').strip()) < 10:
+            raise forms.ValidationError(
+                "Prompt must be at least 10 characters long" if prompt else "Prompt cannot be empty"
+            )
         return prompt
     
     def clean(self):
         cleaned_data = super().clean()
-        size = cleaned_data.get('size')
         
-        # Parse width and height from size if provided
-        if size and 'x' in size:
-            try:
-                width, height = map(int, size.split('x'))
-                cleaned_data['width'] = width
-                cleaned_data['height'] = height
-            except (ValueError, IndexError):
-                pass
+        # The blank "Default" option is the only size not in SIZE_MAP
+        size = cleaned_data.get('size')
+        if size:
+            cleaned_data['width'], cleaned_data['height'] = self.SIZE_MAP[size]
         
         return cleaned_data
 
@@ -326,11 +404,7 @@ class QuickVideoForm(forms.Form):
     """Simplified form for quick video generation"""
     
     prompt = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 3,
-            "placeholder": "Quick video description...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(3, "Quick video description...")),
         label="Video Prompt",
         help_text="Describe the video you want to generate"
     )
@@ -340,12 +414,7 @@ class AudioGenerationForm(forms.Form):
     """Form for audio generation requests"""
     
     text = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 6,
-            "placeholder": "Enter the text you want to convert to speech...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "maxlength": "5000"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(6, "Enter the text you want to convert to speech...", maxlength="5000")),
         label="Text to Speech",
         max_length=5000,
         help_text="Enter text to convert to audio (up to 5000 characters)"
@@ -353,19 +422,18 @@ class AudioGenerationForm(forms.Form):
     
     # Voice selection - Dynamic
     voice_id = forms.ChoiceField(
+        choices=_voice_choices,
         required=False,
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Voice",
         help_text="Choose a voice for the speech generation"
     )
     
     # Model selection - Updated for new service
     model = forms.ChoiceField(
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        choices=TTS_MODEL_CHOICES,
+        initial='microsoft/speecht5_tts',
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="TTS Model",
         help_text="Choose the text-to-speech model"
     )
@@ -375,12 +443,7 @@ class AudioGenerationForm(forms.Form):
         initial=0.5,
         min_value=0.0,
         max_value=1.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "step": "0.1",
-            "min": "0.0",
-            "max": "1.0"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(step="0.1", min="0.0", max="1.0")),
         label="Stability",
         help_text="Voice stability (0.0-1.0, higher = more stable but less expressive)"
     )
@@ -389,104 +452,7 @@ class AudioGenerationForm(forms.Form):
         initial=0.5,
         min_value=0.0,
         max_value=1.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "step": "0.1",
-            "min": "0.0",
-            "max": "1.0"
-        }),
-        label="Similarity Boost",
-        help_text="Voice similarity boost (0.0-1.0, higher = more similar to original voice)"
-    )
-    
-    style = forms.FloatField(
-        initial=0.0,
-        min_value=0.0,
-        max_value=1.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "step": "0.1",
-            "min": "0.0",
-            "max": "1.0"
-        }),
-        label="Style",
-        help_text="Style exaggeration (0.0-1.0, higher = more exaggerated)"
-    )
-    
-    use_speaker_boost = forms.BooleanField(
-        required=False,
-        initial=True,
-        widget=forms.CheckboxInput(attrs={
-            "class": "rounded bg-gray-800 border-gray-700 text-intellihub-primary focus:ring-intellihub-primary"
-        }),
-        label="Enable Speaker Boost",
-        help_text="Boost speaker clarity and volume"
-    )
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Dynamically load available voices
-        try:
-            voices = get_available_voices()
-            if voices:
-                self.fields['voice_id'].choices = [('', 'Default')] + [(voice['id'], voice['name']) for voice in voices]
-            else:
-                # Fallback choices if service is unavailable
-                self.fields['voice_id'].choices = [
-                    ('', 'Default'),
-                    ('default', 'Default Voice'),
-                    ('v2/en_speaker_6', 'Bark Speaker 6'),
-                ]
-        except Exception:
-            # Fallback if service call fails
-            self.fields['voice_id'].choices = [
-                ('', 'Default'),
-                ('default', 'Default Voice'),
-            ]
-        
-        # Set model choices
-        self.fields['model'].choices = [
-            ('microsoft/speecht5_tts', 'Microsoft SpeechT5 (Recommended)'),
-            ('facebook/mms-tts-eng', 'Facebook MMS TTS'),
-            ('espnet/kan-bayashi_ljspeech_vits', 'VITS TTS'),
-            ('suno/bark', 'Bark TTS'),
-            ('tts-1', 'TTS-1 (Fallback)'),
-        ]
-        self.fields['model'].initial = 'microsoft/speecht5_tts'
-    
-    def clean_text(self):
-        text = self.cleaned_data.get('text', '').strip()
-        if not text:
-            raise forms.ValidationError("Text cannot be empty")
-        if len(text) < 5:
-            raise forms.ValidationError("Text must be at least 5 characters long")
-        return text
-    
-    # Voice settings
-    stability = forms.FloatField(
-        initial=0.5,
-        min_value=0.0,
-        max_value=1.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "step": "0.1",
-            "min": "0.0",
-            "max": "1.0"
-        }),
-        label="Stability",
-        help_text="Voice stability (0.0-1.0, higher = more stable but less expressive)"
-    )
-    
-    similarity_boost = forms.FloatField(
-        initial=0.5,
-        min_value=0.0,
-        max_value=1.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "step": "0.1",
-            "min": "0.0",
-            "max": "1.0"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(step="0.1", min="0.0", max="1.0")),
         label="Similarity Boost",
         help_text="Voice similarity boost (0.0-1.0, higher = closer to original voice)"
     )
@@ -495,12 +461,7 @@ class AudioGenerationForm(forms.Form):
         initial=0.0,
         min_value=0.0,
         max_value=1.0,
-        widget=forms.NumberInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "step": "0.1",
-            "min": "0.0",
-            "max": "1.0"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(step="0.1", min="0.0", max="1.0")),
         label="Style",
         help_text="Style exaggeration (0.0-1.0, higher = more stylized)"
     )
@@ -515,53 +476,28 @@ class AudioGenerationForm(forms.Form):
         help_text="Enable speaker boost for better clarity"
     )
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Populate voice choices dynamically
-        try:
-            voices = get_available_voices()
-            voice_choices = [('', 'Default')] + [(voice['id'], voice['name']) for voice in voices]
-            self.fields['voice_id'].choices = voice_choices
-        except Exception:
-            # Fallback choices if service is unavailable
-            self.fields['voice_id'].choices = [
-                ('', 'Default'),
-                ('alloy', 'Alloy'),
-                ('echo', 'Echo'),
-                ('fable', 'Fable'),
-                ('onyx', 'Onyx'),
-                ('nova', 'Nova'),
-                ('shimmer', 'Shimmer'),
-            ]
+    def clean_text(self):
+        if len(text := (self.cleaned_data.get('text') or '').strip()) < 5:
+            raise forms.ValidationError(
+                "Text must be at least 5 characters long" if text else "Text cannot be empty"
+            )
+        return text
 
 
 class QuickAudioForm(forms.Form):
     """Simplified form for quick audio generation"""
     
     text = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 4,
-            "placeholder": "Enter text to convert to speech...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary",
-            "maxlength": "1000"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(4, "Enter text to convert to speech...", maxlength="1000")),
         label="Text",
         max_length=1000,
         help_text="Enter text to convert to audio (up to 1000 characters)"
     )
     
     voice = forms.ChoiceField(
-        choices=[
-            ('alloy', 'Alloy (Neutral)'),
-            ('echo', 'Echo (Professional)'),
-            ('fable', 'Fable (Storytelling)'),
-            ('onyx', 'Onyx (Deep)'),
-        ],
+        choices=QUICK_AUDIO_VOICES,
         initial='alloy',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Voice",
         help_text="Choose a voice for the speech"
     )
@@ -571,42 +507,28 @@ class PresentationGenerationForm(forms.Form):
     """Form for presentation generation requests"""
     
     title = forms.CharField(
-        widget=forms.TextInput(attrs={
-            "placeholder": "My Presentation Title",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.TextInput(attrs=_input_attrs(placeholder="My Presentation Title")),
         label="Presentation Title",
         max_length=200,
         help_text="Give your presentation a compelling title"
     )
     
     topic = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 3,
-            "placeholder": "Describe your presentation topic, key objectives, and main points you want to cover...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(3, "Describe your presentation topic, key objectives, and main points you want to cover...")),
         label="Topic & Objectives",
         max_length=500,
         help_text="Describe what your presentation should cover"
     )
     
     description = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 2,
-            "placeholder": "Brief description or context (optional)...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(2, "Brief description or context (optional)...")),
         label="Description",
         required=False,
         help_text="Additional context or background information"
     )
     
     target_audience = forms.CharField(
-        widget=forms.TextInput(attrs={
-            "placeholder": "e.g., executives, students, clients, team members...",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.TextInput(attrs=_input_attrs(placeholder="e.g., executives, students, clients, team members...")),
         label="Target Audience",
         max_length=200,
         required=False,
@@ -614,31 +536,15 @@ class PresentationGenerationForm(forms.Form):
     )
     
     presentation_type = forms.ChoiceField(
-        choices=[
-            ('business', 'Business Presentation'),
-            ('educational', 'Educational/Academic'),
-            ('marketing', 'Marketing Pitch'),
-            ('report', 'Report/Analysis'),
-            ('proposal', 'Project Proposal'),
-            ('training', 'Training Material'),
-            ('portfolio', 'Portfolio Showcase'),
-            ('other', 'Other'),
-        ],
+        choices=PRESENTATION_TYPE_CHOICES,
         initial='business',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Presentation Type",
         help_text="What type of presentation are you creating?"
     )
     
     slide_count = forms.IntegerField(
-        widget=forms.NumberInput(attrs={
-            "min": 3,
-            "max": 50,
-            "value": 10,
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(min=3, max=50, value=10)),
         label="Number of Slides",
         min_value=3,
         max_value=50,
@@ -647,64 +553,31 @@ class PresentationGenerationForm(forms.Form):
     )
     
     theme = forms.ChoiceField(
-        choices=[
-            ('modern', 'Modern & Clean'),
-            ('corporate', 'Corporate Professional'),
-            ('creative', 'Creative & Colorful'),
-            ('minimal', 'Minimal & Simple'),
-            ('academic', 'Academic & Traditional'),
-            ('tech', 'Technology Focused'),
-            ('nature', 'Nature & Organic'),
-            ('dark', 'Dark & Bold'),
-        ],
+        choices=PRESENTATION_THEMES,
         initial='modern',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Theme",
         help_text="Choose a visual theme for your presentation"
     )
     
     color_scheme = forms.ChoiceField(
-        choices=[
-            ('blue', 'Professional Blue'),
-            ('green', 'Fresh Green'),
-            ('purple', 'Creative Purple'),
-            ('orange', 'Energetic Orange'),
-            ('red', 'Bold Red'),
-            ('teal', 'Modern Teal'),
-            ('gray', 'Elegant Gray'),
-            ('custom', 'Custom Colors'),
-        ],
+        choices=PRESENTATION_COLOR_SCHEMES,
         initial='blue',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Color Scheme",
         help_text="Select the primary color scheme"
     )
     
     tone = forms.ChoiceField(
-        choices=[
-            ('professional', 'Professional'),
-            ('casual', 'Casual & Friendly'),
-            ('formal', 'Formal & Academic'),
-            ('persuasive', 'Persuasive & Compelling'),
-            ('educational', 'Educational & Clear'),
-            ('inspiring', 'Inspiring & Motivational'),
-        ],
+        choices=PRESENTATION_TONES,
         initial='professional',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Tone",
         help_text="What tone should your presentation have?"
     )
     
     include_images = forms.BooleanField(
-        widget=forms.CheckboxInput(attrs={
-            "class": "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label="Include Images",
         required=False,
         initial=True,
@@ -712,9 +585,7 @@ class PresentationGenerationForm(forms.Form):
     )
     
     include_charts = forms.BooleanField(
-        widget=forms.CheckboxInput(attrs={
-            "class": "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label="Include Charts",
         required=False,
         initial=True,
@@ -726,23 +597,14 @@ class QuickPresentationForm(forms.Form):
     """Simplified form for quick presentation generation"""
     
     topic = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 3,
-            "placeholder": "What do you want to create a presentation about?",
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(3, "What do you want to create a presentation about?")),
         label="Presentation Topic",
         max_length=500,
         help_text="Describe your presentation topic and key points"
     )
     
     slide_count = forms.IntegerField(
-        widget=forms.NumberInput(attrs={
-            "min": 5,
-            "max": 20,
-            "value": 10,
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.NumberInput(attrs=_input_attrs(min=5, max=20, value=10)),
         label="Slides",
         min_value=5,
         max_value=20,
@@ -751,16 +613,9 @@ class QuickPresentationForm(forms.Form):
     )
     
     presentation_type = forms.ChoiceField(
-        choices=[
-            ('business', 'Business'),
-            ('educational', 'Educational'),
-            ('marketing', 'Marketing'),
-            ('other', 'Other'),
-        ],
+        choices=QUICK_PRESENTATION_TYPE_CHOICES,
         initial='business',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Type"
     )
 
@@ -769,76 +624,42 @@ class SlideEditForm(forms.Form):
     """Form for editing individual slides"""
     
     title = forms.CharField(
-        widget=forms.TextInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.TextInput(attrs=_INPUT_ATTRS),
         label="Slide Title",
         max_length=300,
         required=False
     )
     
     subtitle = forms.CharField(
-        widget=forms.TextInput(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.TextInput(attrs=_INPUT_ATTRS),
         label="Subtitle",
         max_length=500,
         required=False
     )
     
     content = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 6,
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(6)),
         label="Content",
         required=False,
         help_text="Main slide content"
     )
     
     notes = forms.CharField(
-        widget=forms.Textarea(attrs={
-            "rows": 3,
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Textarea(attrs=_textarea_attrs(3)),
         label="Speaker Notes",
         required=False,
         help_text="Notes for the presenter"
     )
     
-    slide_type = forms.ChoiceField(
-        choices=[
-            ('title', 'Title Slide'),
-            ('content', 'Content Slide'),
-            ('bullet_points', 'Bullet Points'),
-            ('two_column', 'Two Column Layout'),
-            ('image_text', 'Image with Text'),
-            ('chart', 'Chart/Graph'),
-            ('quote', 'Quote/Testimonial'),
-            ('call_to_action', 'Call to Action'),
-            ('thank_you', 'Thank You/Contact'),
-            ('section_break', 'Section Break'),
-        ],
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+    slide_type = StaticChoiceField(
+        choices=SLIDE_TYPE_CHOICES,
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Slide Type"
     )
     
-    layout = forms.ChoiceField(
-        choices=[
-            ('default', 'Default Layout'),
-            ('centered', 'Centered Content'),
-            ('left_aligned', 'Left Aligned'),
-            ('split_half', 'Split 50/50'),
-            ('two_thirds_left', 'Two-thirds Left'),
-            ('two_thirds_right', 'Two-thirds Right'),
-            ('full_image', 'Full Background Image'),
-            ('minimal', 'Minimal Text'),
-        ],
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+    layout = StaticChoiceField(
+        choices=SLIDE_LAYOUT_CHOICES,
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Layout"
     )
 
@@ -847,18 +668,14 @@ class PresentationShareForm(forms.Form):
     """Form for sharing presentations"""
     
     is_public = forms.BooleanField(
-        widget=forms.CheckboxInput(attrs={
-            "class": "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label="Make Public",
         required=False,
         help_text="Allow others to view this presentation"
     )
     
     generate_link = forms.BooleanField(
-        widget=forms.CheckboxInput(attrs={
-            "class": "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label="Generate Sharing Link",
         required=False,
         help_text="Create a unique link for sharing"
@@ -868,26 +685,16 @@ class PresentationShareForm(forms.Form):
 class PresentationExportForm(forms.Form):
     """Form for exporting presentations"""
     
-    export_format = forms.ChoiceField(
-        choices=[
-            ('pdf', 'PDF Document'),
-            ('pptx', 'PowerPoint (.pptx)'),
-            ('html', 'HTML Presentation'),
-            ('images', 'Image Files (ZIP)'),
-            ('json', 'JSON Data'),
-        ],
+    export_format = StaticChoiceField(
+        choices=EXPORT_FORMAT_CHOICES,
         initial='pdf',
-        widget=forms.Select(attrs={
-            "class": "w-full px-3 py-2 bg-gray-800 border border-gray-700 rounded text-gray-100 focus:outline-none focus:ring-2 focus:ring-intellihub-primary"
-        }),
+        widget=forms.Select(attrs=_INPUT_ATTRS),
         label="Export Format",
         help_text="Choose the export format"
     )
     
     include_notes = forms.BooleanField(
-        widget=forms.CheckboxInput(attrs={
-            "class": "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label="Include Speaker Notes",
         required=False,
         initial=True,
@@ -895,9 +702,7 @@ class PresentationExportForm(forms.Form):
     )
     
     high_quality = forms.BooleanField(
-        widget=forms.CheckboxInput(attrs={
-            "class": "w-4 h-4 text-intellihub-primary bg-gray-800 border-gray-600 rounded focus:ring-intellihub-primary focus:ring-2"
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label="High Quality",
         required=False,
         initial=True,
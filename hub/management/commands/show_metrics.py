@@ -1,12 +1,43 @@
 from django.core.management.base import BaseCommand
 import json
+import time
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder is used instead
+    orjson = None
 
 from hub.services.openrouter import get_metrics
 
 
+def _dumps(data):
+    """Pretty-print data as JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 class Command(BaseCommand):
     help = 'Show in-process OpenRouter metrics (reset on process restart)'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=0,
+            help='Print a snapshot every N seconds until interrupted (default: print once)',
+        )
+
     def handle(self, *args, **options):
-        metrics = get_metrics()
-        self.stdout.write(json.dumps(metrics, indent=2))
+        interval = options['interval']
+        if interval <= 0:
+            self.stdout.write(_dumps(get_metrics()))
+            return
+
+        try:
+            while True:
+                self.stdout.write(_dumps(get_metrics()))
+                self.stdout.flush()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
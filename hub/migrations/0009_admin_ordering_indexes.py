@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-16 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0008_codefile_ideproject_useridepreferences_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='codeexecutionresult',
+            index=models.Index(fields=['-created_at'], name='hub_codeexe_created_e4d926_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='generatedimage',
+            index=models.Index(fields=['-created_at'], name='hub_generat_created_8e4cad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='idechatmessage',
+            index=models.Index(fields=['-created_at'], name='hub_idechat_created_e3baac_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ideproject',
+            index=models.Index(fields=['-updated_at'], name='hub_ideproj_updated_e924ad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageupscalerequest',
+            index=models.Index(fields=['-created_at'], name='hub_imageup_created_238bc4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectdeployment',
+            index=models.Index(fields=['-created_at'], name='hub_project_created_46e23e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectexport',
+            index=models.Index(fields=['-created_at'], name='hub_project_created_b203a7_idx'),
+        ),
+    ]
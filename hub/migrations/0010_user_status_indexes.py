@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-16 20:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0009_admin_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audiogenerationrequest',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='hub_audioge_user_id_570e7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imagegenerationrequest',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='hub_imagege_user_id_ffb651_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageupscalerequest',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='hub_imageup_user_id_cce941_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='presentationproject',
+            index=models.Index(fields=['user', 'status', '-updated_at'], name='hub_present_user_id_040880_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videogenerationrequest',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='hub_videoge_user_id_9bead4_idx'),
+        ),
+    ]
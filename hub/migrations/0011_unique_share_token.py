@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-16 20:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0010_user_status_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='presentationproject',
+            name='hub_present_share_t_e677e7_idx',
+        ),
+        migrations.AlterField(
+            model_name='presentationproject',
+            name='share_token',
+            field=models.CharField(blank=True, help_text='Unique sharing token', max_length=100, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:40
+
+import base64
+
+from django.db import migrations, models
+
+
+MEDIA_FIELDS = (
+    ('GeneratedImage', 'image_data'),
+    ('GeneratedVideo', 'video_data'),
+    ('GeneratedAudio', 'audio_data'),
+)
+
+
+def decode_media(apps, schema_editor):
+    for model_name, field in MEDIA_FIELDS:
+        model = apps.get_model('hub', model_name)
+        for pk, data in model.objects.values_list('pk', field).iterator(chunk_size=100):
+            model.objects.filter(pk=pk).update(**{f'{field}_raw': base64.b64decode(data)})
+
+
+def encode_media(apps, schema_editor):
+    for model_name, field in MEDIA_FIELDS:
+        model = apps.get_model('hub', model_name)
+        for pk, data in model.objects.values_list('pk', f'{field}_raw').iterator(chunk_size=100):
+            model.objects.filter(pk=pk).update(**{field: base64.b64encode(data).decode('ascii')})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0011_unique_share_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedimage',
+            name='image_data_raw',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.AddField(
+            model_name='generatedvideo',
+            name='video_data_raw',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.AddField(
+            model_name='generatedaudio',
+            name='audio_data_raw',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.AlterField(
+            model_name='generatedimage',
+            name='image_data',
+            field=models.TextField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='generatedvideo',
+            name='video_data',
+            field=models.TextField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='generatedaudio',
+            name='audio_data',
+            field=models.TextField(null=True),
+        ),
+        migrations.RunPython(decode_media, encode_media),
+        migrations.RemoveField(
+            model_name='generatedimage',
+            name='image_data',
+        ),
+        migrations.RemoveField(
+            model_name='generatedvideo',
+            name='video_data',
+        ),
+        migrations.RemoveField(
+            model_name='generatedaudio',
+            name='audio_data',
+        ),
+        migrations.RenameField(
+            model_name='generatedimage',
+            old_name='image_data_raw',
+            new_name='image_data',
+        ),
+        migrations.RenameField(
+            model_name='generatedvideo',
+            old_name='video_data_raw',
+            new_name='video_data',
+        ),
+        migrations.RenameField(
+            model_name='generatedaudio',
+            old_name='audio_data_raw',
+            new_name='audio_data',
+        ),
+        migrations.AlterField(
+            model_name='generatedimage',
+            name='image_data',
+            field=models.BinaryField(help_text='Raw image file bytes'),
+        ),
+        migrations.AlterField(
+            model_name='generatedvideo',
+            name='video_data',
+            field=models.BinaryField(help_text='Raw video file bytes'),
+        ),
+        migrations.AlterField(
+            model_name='generatedaudio',
+            name='audio_data',
+            field=models.BinaryField(help_text='Raw audio file bytes'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.7 on 2026-10-16 22:05
+
+import base64
+
+from django.db import migrations, models
+
+
+EXPORT_MODELS = ('PresentationExport', 'ProjectExport')
+
+
+def decode_exports(apps, schema_editor):
+    for model_name in EXPORT_MODELS:
+        model = apps.get_model('hub', model_name)
+        rows = model.objects.exclude(file_data=None).values_list('pk', 'file_data')
+        for pk, data in rows.iterator(chunk_size=100):
+            model.objects.filter(pk=pk).update(file_data_raw=base64.b64decode(data))
+
+
+def encode_exports(apps, schema_editor):
+    for model_name in EXPORT_MODELS:
+        model = apps.get_model('hub', model_name)
+        rows = model.objects.exclude(file_data_raw=None).values_list('pk', 'file_data_raw')
+        for pk, data in rows.iterator(chunk_size=100):
+            model.objects.filter(pk=pk).update(file_data=base64.b64encode(data).decode('ascii'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0012_binary_media_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='presentationexport',
+            name='file_data_raw',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='projectexport',
+            name='file_data_raw',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(decode_exports, encode_exports),
+        migrations.RemoveField(
+            model_name='presentationexport',
+            name='file_data',
+        ),
+        migrations.RemoveField(
+            model_name='projectexport',
+            name='file_data',
+        ),
+        migrations.RenameField(
+            model_name='presentationexport',
+            old_name='file_data_raw',
+            new_name='file_data',
+        ),
+        migrations.RenameField(
+            model_name='projectexport',
+            old_name='file_data_raw',
+            new_name='file_data',
+        ),
+        migrations.AlterField(
+            model_name='presentationexport',
+            name='file_data',
+            field=models.BinaryField(blank=True, help_text='Raw export file bytes', null=True),
+        ),
+        migrations.AlterField(
+            model_name='projectexport',
+            name='file_data',
+            field=models.BinaryField(blank=True, help_text='Raw export file bytes', null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0013_binary_export_data'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='codefile',
+            name='hub_codefil_project_b46ab6_idx',
+        ),
+    ]
@@ -1,7 +1,87 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+from django.urls import reverse
+from django.utils.functional import cached_property
 import json
+import os
+
+
+class DeferredDataManager(models.Manager):
+    """Manager that leaves large payload columns out of queries by default"""
+    
+    deferred_fields = ()
+    
+    def get_queryset(self):
+        return super().get_queryset().defer(*self.deferred_fields)
+    
+    def with_data(self):
+        """Queryset that also loads the deferred payload columns"""
+        return self.get_queryset().defer(None)
+
+
+class GeneratedImageManager(DeferredDataManager):
+    deferred_fields = ('image_data',)
+
+
+class GeneratedVideoManager(DeferredDataManager):
+    deferred_fields = ('video_data',)
+
+
+class GeneratedAudioManager(DeferredDataManager):
+    deferred_fields = ('audio_data',)
+
+
+class PresentationTemplateManager(DeferredDataManager):
+    deferred_fields = ('template_data', 'preview_image')
+
+
+class ExportManager(DeferredDataManager):
+    deferred_fields = ('file_data',)
+
+
+class UserPreferencesManager(models.Manager):
+    def get_for_user(self, user):
+        """Return the user's preferences row, creating it on first use.
+        
+        The create is an INSERT ... ON CONFLICT DO NOTHING, so a concurrent
+        first request can't fail it and no savepoint is needed.
+        """
+        try:
+            return self.get(user=user)
+        except self.model.DoesNotExist:
+            self.bulk_create([self.model(user=user)], ignore_conflicts=True)
+            return self.get(user=user)
+    
+    def increment(self, user, **counts):
+        """Add to the user's usage counters in one UPDATE, without loading the row"""
+        values = {field: models.F(field) + n for field, n in counts.items()}
+        values['updated_at'] = timezone.now()
+        if not self.filter(user=user).update(**values):
+            self.get_for_user(user)
+            self.filter(user=user).update(**values)
+
+
+class ChatConversationQuerySet(models.QuerySet):
+    def with_last_message(self):
+        """Fetch each conversation's latest message in one extra query for the whole list"""
+        return self.prefetch_related(models.Prefetch(
+            'messages',
+            queryset=ChatMessage.objects.order_by('-created_at')[:1],
+            to_attr='_last_message',
+        ))
+
+
+class PresentationProjectQuerySet(models.QuerySet):
+    def with_slide_counts(self):
+        """Annotate the number of slides so slide_count_actual needs no query per row"""
+        return self.annotate(_slide_count=models.Count('slides'))
+
+
+class IDEProjectQuerySet(models.QuerySet):
+    def with_file_counts(self):
+        """Annotate the number of files so file_count needs no query per row"""
+        return self.annotate(_file_count=models.Count('files'))
 
 
 class ChatConversation(models.Model):
@@ -12,6 +92,8 @@ class ChatConversation(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ChatConversationQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-updated_at']
         indexes = [
@@ -25,16 +107,19 @@ class ChatConversation(models.Model):
     @property
     def last_message(self):
         """Get the last message in this conversation"""
+        # Set by ChatConversationQuerySet.with_last_message()
+        if hasattr(self, '_last_message'):
+            return self._last_message[0] if self._last_message else None
         return self.messages.first()
 
 
 class ChatMessage(models.Model):
     """Model to store individual chat messages"""
     
-    ROLE_CHOICES = [
+    ROLE_CHOICES = (
         ('user', 'User'),
         ('assistant', 'Assistant'),
-    ]
+    )
     
     conversation = models.ForeignKey(ChatConversation, on_delete=models.CASCADE, related_name='messages')
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
@@ -78,12 +163,12 @@ class ImageGenerationRequest(models.Model):
     seed = models.BigIntegerField(blank=True, null=True, help_text="Random seed for reproducible results")
     
     # Status tracking
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Results
@@ -98,6 +183,7 @@ class ImageGenerationRequest(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at']),
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
         ]
@@ -124,7 +210,7 @@ class GeneratedImage(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     
     # Image data
-    image_data = models.TextField(help_text="Base64 encoded image data")
+    image_data = models.BinaryField(help_text="Raw image file bytes")
     seed_used = models.BigIntegerField(blank=True, null=True, help_text="Seed used for this specific image")
     finish_reason = models.CharField(max_length=50, blank=True, null=True, help_text="Completion status from API")
     
@@ -136,21 +222,24 @@ class GeneratedImage(models.Model):
     favorited = models.BooleanField(default=False, help_text="Whether user marked as favorite")
     public = models.BooleanField(default=False, help_text="Whether image is publicly viewable")
     
+    objects = GeneratedImageManager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['request', '-created_at']),
             models.Index(fields=['favorited']),
             models.Index(fields=['public']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
-        return f"Image for request {self.request.id} (seed: {self.seed_used})"
+        return f"Image for request {self.request_id} (seed: {self.seed_used})"
     
-    @property
+    @cached_property
     def image_url(self):
-        """Return data URL for the image"""
-        return f"data:{self.mime_type};base64,{self.image_data}"
+        """Return the URL serving the decoded image"""
+        return reverse('generated_image_file', args=[self.pk])
 
 class ImageUpscaleRequest(models.Model):
     """Model to store image upscaling requests"""
@@ -164,12 +253,12 @@ class ImageUpscaleRequest(models.Model):
     target_height = models.IntegerField(blank=True, null=True)
     
     # Status and results
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     processing_time = models.FloatField(blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
@@ -181,11 +270,13 @@ class ImageUpscaleRequest(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at']),
             models.Index(fields=['status']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
-        return f"Upscale request by {self.user.username} for image {self.original_image.id}"
+        return f"Upscale request by {self.user.username} for image {self.original_image_id}"
     
     @property
     def upscaled_image_url(self):
@@ -214,14 +305,21 @@ class UserImagePreferences(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserPreferencesManager()
+    
     def __str__(self):
         return f"Image preferences for {self.user.username}"
     
     def update_stats(self, generation_time: float, images_count: int = 1):
         """Update user statistics after image generation"""
+        # Single atomic UPDATE, so concurrent generations don't lose increments
+        type(self).objects.filter(pk=self.pk).update(
+            total_images_generated=models.F('total_images_generated') + images_count,
+            total_generation_time=models.F('total_generation_time') + generation_time,
+            updated_at=timezone.now(),
+        )
         self.total_images_generated += images_count
         self.total_generation_time += generation_time
-        self.save()
 
 
 class VideoGenerationRequest(models.Model):
@@ -241,12 +339,12 @@ class VideoGenerationRequest(models.Model):
     height = models.IntegerField(blank=True, null=True, help_text="Video height in pixels")
     
     # Status tracking
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Results
@@ -260,6 +358,7 @@ class VideoGenerationRequest(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at']),
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
         ]
@@ -287,7 +386,7 @@ class GeneratedVideo(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     
     # Video data
-    video_data = models.TextField(help_text="Base64 encoded video data")
+    video_data = models.BinaryField(help_text="Raw video file bytes")
     file_size = models.IntegerField(blank=True, null=True, help_text="Video file size in bytes")
     mime_type = models.CharField(max_length=50, default='video/mp4')
     
@@ -295,6 +394,8 @@ class GeneratedVideo(models.Model):
     favorited = models.BooleanField(default=False, help_text="Whether user marked as favorite")
     public = models.BooleanField(default=False, help_text="Whether video is publicly viewable")
     
+    objects = GeneratedVideoManager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -304,12 +405,12 @@ class GeneratedVideo(models.Model):
         ]
     
     def __str__(self):
-        return f"Video for request {self.request.id}"
+        return f"Video for request {self.request_id}"
     
-    @property
+    @cached_property
     def video_url(self):
-        """Return data URL for the video"""
-        return f"data:{self.mime_type};base64,{self.video_data}"
+        """Return the URL serving the decoded video"""
+        return reverse('generated_video_file', args=[self.pk])
 
 
 class UserVideoPreferences(models.Model):
@@ -331,14 +432,21 @@ class UserVideoPreferences(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserPreferencesManager()
+    
     def __str__(self):
         return f"Video preferences for {self.user.username}"
     
     def update_stats(self, generation_time: float, videos_count: int = 1):
         """Update user statistics after video generation"""
+        # Single atomic UPDATE, so concurrent generations don't lose increments
+        type(self).objects.filter(pk=self.pk).update(
+            total_videos_generated=models.F('total_videos_generated') + videos_count,
+            total_generation_time=models.F('total_generation_time') + generation_time,
+            updated_at=timezone.now(),
+        )
         self.total_videos_generated += videos_count
         self.total_generation_time += generation_time
-        self.save()
 
 
 class AudioGenerationRequest(models.Model):
@@ -359,12 +467,12 @@ class AudioGenerationRequest(models.Model):
     use_speaker_boost = models.BooleanField(default=True, help_text="Enable speaker boost")
     
     # Status tracking
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Results
@@ -380,6 +488,7 @@ class AudioGenerationRequest(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at']),
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
         ]
@@ -407,7 +516,7 @@ class GeneratedAudio(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     
     # Audio data
-    audio_data = models.TextField(help_text="Base64 encoded audio data")
+    audio_data = models.BinaryField(help_text="Raw audio file bytes")
     file_size = models.IntegerField(blank=True, null=True, help_text="Audio file size in bytes")
     mime_type = models.CharField(max_length=50, default='audio/mpeg')
     duration = models.FloatField(blank=True, null=True, help_text="Audio duration in seconds")
@@ -416,6 +525,8 @@ class GeneratedAudio(models.Model):
     favorited = models.BooleanField(default=False, help_text="Whether user marked as favorite")
     public = models.BooleanField(default=False, help_text="Whether audio is publicly viewable")
     
+    objects = GeneratedAudioManager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -425,12 +536,12 @@ class GeneratedAudio(models.Model):
         ]
     
     def __str__(self):
-        return f"Audio for request {self.request.id}"
+        return f"Audio for request {self.request_id}"
     
-    @property
+    @cached_property
     def audio_url(self):
-        """Return data URL for the audio"""
-        return f"data:{self.mime_type};base64,{self.audio_data}"
+        """Return the URL serving the decoded audio"""
+        return reverse('generated_audio_file', args=[self.pk])
 
 
 class UserAudioPreferences(models.Model):
@@ -454,15 +565,23 @@ class UserAudioPreferences(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserPreferencesManager()
+    
     def __str__(self):
         return f"Audio preferences for {self.user.username}"
     
     def update_stats(self, generation_time: float, character_count: int, audio_count: int = 1):
         """Update user statistics after audio generation"""
+        # Single atomic UPDATE, so concurrent generations don't lose increments
+        type(self).objects.filter(pk=self.pk).update(
+            total_audio_generated=models.F('total_audio_generated') + audio_count,
+            total_generation_time=models.F('total_generation_time') + generation_time,
+            total_characters_processed=models.F('total_characters_processed') + character_count,
+            updated_at=timezone.now(),
+        )
         self.total_audio_generated += audio_count
         self.total_generation_time += generation_time
         self.total_characters_processed += character_count
-        self.save()
 
 
 class PresentationProject(models.Model):
@@ -476,7 +595,7 @@ class PresentationProject(models.Model):
     # Generation parameters
     topic = models.CharField(max_length=500, help_text="Main topic or theme")
     target_audience = models.CharField(max_length=200, blank=True, null=True, help_text="Target audience")
-    presentation_type = models.CharField(max_length=100, choices=[
+    PRESENTATION_TYPE_CHOICES = (
         ('business', 'Business Presentation'),
         ('educational', 'Educational/Academic'),
         ('marketing', 'Marketing Pitch'),
@@ -484,11 +603,12 @@ class PresentationProject(models.Model):
         ('proposal', 'Project Proposal'),
         ('training', 'Training Material'),
         ('portfolio', 'Portfolio Showcase'),
-        ('other', 'Other')
-    ], default='business')
+        ('other', 'Other'),
+    )
+    presentation_type = models.CharField(max_length=100, choices=PRESENTATION_TYPE_CHOICES, default='business')
     
     # Styling and preferences
-    theme = models.CharField(max_length=100, choices=[
+    THEME_CHOICES = (
         ('modern', 'Modern & Clean'),
         ('corporate', 'Corporate Professional'),
         ('creative', 'Creative & Colorful'),
@@ -496,10 +616,11 @@ class PresentationProject(models.Model):
         ('academic', 'Academic & Traditional'),
         ('tech', 'Technology Focused'),
         ('nature', 'Nature & Organic'),
-        ('dark', 'Dark & Bold')
-    ], default='modern')
+        ('dark', 'Dark & Bold'),
+    )
+    theme = models.CharField(max_length=100, choices=THEME_CHOICES, default='modern')
     
-    color_scheme = models.CharField(max_length=100, choices=[
+    COLOR_SCHEME_CHOICES = (
         ('blue', 'Professional Blue'),
         ('green', 'Fresh Green'),
         ('purple', 'Creative Purple'),
@@ -507,30 +628,32 @@ class PresentationProject(models.Model):
         ('red', 'Bold Red'),
         ('teal', 'Modern Teal'),
         ('gray', 'Elegant Gray'),
-        ('custom', 'Custom Colors')
-    ], default='blue')
+        ('custom', 'Custom Colors'),
+    )
+    color_scheme = models.CharField(max_length=100, choices=COLOR_SCHEME_CHOICES, default='blue')
     
     # Status tracking
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('draft', 'Draft'),
         ('generating', 'Generating'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     
     # Generation settings
     slide_count = models.IntegerField(default=10, help_text="Target number of slides")
     include_images = models.BooleanField(default=True, help_text="Generate relevant images")
     include_charts = models.BooleanField(default=True, help_text="Include charts and graphs")
-    tone = models.CharField(max_length=100, choices=[
+    TONE_CHOICES = (
         ('professional', 'Professional'),
         ('casual', 'Casual & Friendly'),
         ('formal', 'Formal & Academic'),
         ('persuasive', 'Persuasive & Compelling'),
         ('educational', 'Educational & Clear'),
-        ('inspiring', 'Inspiring & Motivational')
-    ], default='professional')
+        ('inspiring', 'Inspiring & Motivational'),
+    )
+    tone = models.CharField(max_length=100, choices=TONE_CHOICES, default='professional')
     
     # Timestamps and metadata
     created_at = models.DateTimeField(default=timezone.now)
@@ -541,15 +664,17 @@ class PresentationProject(models.Model):
     
     # Sharing and visibility
     is_public = models.BooleanField(default=False, help_text="Public presentations visible to others")
-    share_token = models.CharField(max_length=100, blank=True, null=True, help_text="Unique sharing token")
+    share_token = models.CharField(max_length=100, unique=True, blank=True, null=True, help_text="Unique sharing token")
+    
+    objects = PresentationProjectQuerySet.as_manager()
     
     class Meta:
         ordering = ['-updated_at']
         indexes = [
             models.Index(fields=['user', '-updated_at']),
+            models.Index(fields=['user', 'status', '-updated_at']),
             models.Index(fields=['status']),
             models.Index(fields=['is_public']),
-            models.Index(fields=['share_token']),
         ]
     
     def __str__(self):
@@ -561,13 +686,23 @@ class PresentationProject(models.Model):
     
     @property
     def slide_count_actual(self):
+        # Set by PresentationProjectQuerySet.with_slide_counts()
+        if hasattr(self, '_slide_count'):
+            return self._slide_count
         return self.slides.count()
     
+    def bulk_create_slides(self, slides_data, batch_size=500):
+        """Create slides from an iterable of field dicts in batched INSERTs"""
+        return PresentationSlide.objects.bulk_create(
+            [PresentationSlide(presentation=self, **data) for data in slides_data],
+            batch_size=batch_size,
+        )
+    
     def generate_share_token(self):
         """Generate a unique sharing token"""
         import secrets
         self.share_token = secrets.token_urlsafe(32)
-        self.save()
+        self.save(update_fields=['share_token', 'updated_at'])
         return self.share_token
 
 
@@ -584,7 +719,7 @@ class PresentationSlide(models.Model):
     notes = models.TextField(blank=True, null=True, help_text="Speaker notes")
     
     # Slide type and layout
-    slide_type = models.CharField(max_length=100, choices=[
+    SLIDE_TYPE_CHOICES = (
         ('title', 'Title Slide'),
         ('content', 'Content Slide'),
         ('bullet_points', 'Bullet Points'),
@@ -594,10 +729,11 @@ class PresentationSlide(models.Model):
         ('quote', 'Quote/Testimonial'),
         ('call_to_action', 'Call to Action'),
         ('thank_you', 'Thank You/Contact'),
-        ('section_break', 'Section Break')
-    ], default='content')
+        ('section_break', 'Section Break'),
+    )
+    slide_type = models.CharField(max_length=100, choices=SLIDE_TYPE_CHOICES, default='content')
     
-    layout = models.CharField(max_length=100, choices=[
+    LAYOUT_CHOICES = (
         ('default', 'Default Layout'),
         ('centered', 'Centered Content'),
         ('left_aligned', 'Left Aligned'),
@@ -605,8 +741,9 @@ class PresentationSlide(models.Model):
         ('two_thirds_left', 'Two-thirds Left'),
         ('two_thirds_right', 'Two-thirds Right'),
         ('full_image', 'Full Background Image'),
-        ('minimal', 'Minimal Text')
-    ], default='default')
+        ('minimal', 'Minimal Text'),
+    )
+    layout = models.CharField(max_length=100, choices=LAYOUT_CHOICES, default='default')
     
     # Styling
     background_color = models.CharField(max_length=50, blank=True, null=True)
@@ -633,7 +770,7 @@ class SlideElement(models.Model):
     """Model to store individual elements within slides (text, images, charts)"""
     
     slide = models.ForeignKey(PresentationSlide, on_delete=models.CASCADE, related_name='elements')
-    element_type = models.CharField(max_length=100, choices=[
+    ELEMENT_TYPE_CHOICES = (
         ('text', 'Text Block'),
         ('heading', 'Heading'),
         ('bullet_list', 'Bullet List'),
@@ -644,8 +781,9 @@ class SlideElement(models.Model):
         ('quote', 'Quote Block'),
         ('divider', 'Divider/Separator'),
         ('button', 'Button/CTA'),
-        ('embed', 'Embedded Content')
-    ])
+        ('embed', 'Embedded Content'),
+    )
+    element_type = models.CharField(max_length=100, choices=ELEMENT_TYPE_CHOICES)
     
     # Position and sizing
     position_x = models.FloatField(default=0, help_text="X position as percentage")
@@ -661,12 +799,13 @@ class SlideElement(models.Model):
     # Styling
     font_size = models.CharField(max_length=50, blank=True, null=True)
     font_weight = models.CharField(max_length=50, blank=True, null=True)
-    text_align = models.CharField(max_length=50, choices=[
+    TEXT_ALIGN_CHOICES = (
         ('left', 'Left'),
         ('center', 'Center'),
         ('right', 'Right'),
-        ('justify', 'Justify')
-    ], default='left')
+        ('justify', 'Justify'),
+    )
+    text_align = models.CharField(max_length=50, choices=TEXT_ALIGN_CHOICES, default='left')
     color = models.CharField(max_length=50, blank=True, null=True)
     background = models.CharField(max_length=100, blank=True, null=True)
     border = models.CharField(max_length=100, blank=True, null=True)
@@ -687,7 +826,7 @@ class SlideElement(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.element_type} in {self.slide}"
+        return f"{self.element_type} in slide {self.slide_id}"
 
 
 class PresentationTemplate(models.Model):
@@ -695,14 +834,15 @@ class PresentationTemplate(models.Model):
     
     name = models.CharField(max_length=200, help_text="Template name")
     description = models.TextField(help_text="Template description")
-    category = models.CharField(max_length=100, choices=[
+    CATEGORY_CHOICES = (
         ('business', 'Business'),
         ('education', 'Education'),
         ('marketing', 'Marketing'),
         ('creative', 'Creative'),
         ('minimal', 'Minimal'),
-        ('corporate', 'Corporate')
-    ])
+        ('corporate', 'Corporate'),
+    )
+    category = models.CharField(max_length=100, choices=CATEGORY_CHOICES)
     
     # Template structure
     template_data = models.JSONField(help_text="Template structure and default content")
@@ -719,6 +859,8 @@ class PresentationTemplate(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PresentationTemplateManager()
+    
     class Meta:
         ordering = ['-usage_count', '-created_at']
         indexes = [
@@ -729,6 +871,11 @@ class PresentationTemplate(models.Model):
     def __str__(self):
         return f"Template: {self.name}"
 
+    @classmethod
+    def increment_usage(cls, pk):
+        """Count one use of a template without loading or re-saving the row"""
+        cls.objects.filter(pk=pk).update(usage_count=models.F('usage_count') + 1)
+
 
 class PresentationExport(models.Model):
     """Model to track presentation exports and downloads"""
@@ -737,32 +884,35 @@ class PresentationExport(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     
     # Export details
-    export_format = models.CharField(max_length=50, choices=[
+    EXPORT_FORMAT_CHOICES = (
         ('pdf', 'PDF'),
         ('pptx', 'PowerPoint'),
         ('html', 'HTML'),
         ('images', 'Image Files'),
-        ('json', 'JSON Data')
-    ])
+        ('json', 'JSON Data'),
+    )
+    export_format = models.CharField(max_length=50, choices=EXPORT_FORMAT_CHOICES)
     
     # File information
     file_size = models.IntegerField(blank=True, null=True)
-    file_data = models.TextField(blank=True, null=True, help_text="Base64 encoded file data")
+    file_data = models.BinaryField(blank=True, null=True, help_text="Raw export file bytes")
     download_url = models.URLField(blank=True, null=True, help_text="External download URL")
     
     # Status
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Timestamps
     created_at = models.DateTimeField(default=timezone.now)
     expires_at = models.DateTimeField(blank=True, null=True, help_text="Export expiration time")
     
+    objects = ExportManager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -814,10 +964,16 @@ class UserPresentationPreferences(models.Model):
     
     def update_stats(self, generation_time: float, slide_count: int, presentation_count: int = 1):
         """Update user statistics after presentation generation"""
+        # Single atomic UPDATE, so concurrent generations don't lose increments
+        type(self).objects.filter(pk=self.pk).update(
+            total_presentations_created=models.F('total_presentations_created') + presentation_count,
+            total_slides_generated=models.F('total_slides_generated') + slide_count,
+            total_generation_time=models.F('total_generation_time') + generation_time,
+            updated_at=timezone.now(),
+        )
         self.total_presentations_created += presentation_count
         self.total_slides_generated += slide_count
         self.total_generation_time += generation_time
-        self.save()
 
 
 # ============================================================================
@@ -832,7 +988,7 @@ class IDEProject(models.Model):
     description = models.TextField(blank=True, null=True, help_text="Project description")
     
     # Project metadata
-    PROJECT_TYPE_CHOICES = [
+    PROJECT_TYPE_CHOICES = (
         ('python', 'Python'),
         ('javascript', 'JavaScript'),
         ('typescript', 'TypeScript'),
@@ -843,7 +999,7 @@ class IDEProject(models.Model):
         ('flask', 'Flask'),
         ('node', 'Node.js'),
         ('other', 'Other'),
-    ]
+    )
     project_type = models.CharField(max_length=50, choices=PROJECT_TYPE_CHOICES, default='python')
     
     # Project settings
@@ -867,21 +1023,39 @@ class IDEProject(models.Model):
     total_executions = models.IntegerField(default=0)
     total_ai_queries = models.IntegerField(default=0)
     
+    objects = IDEProjectQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-updated_at']
         indexes = [
             models.Index(fields=['user', '-updated_at']),
             models.Index(fields=['is_public']),
             models.Index(fields=['-created_at']),
+            models.Index(fields=['-updated_at']),
         ]
     
     def __str__(self):
         return f"{self.name} by {self.user.username}"
     
+    @property
+    def file_count(self):
+        # Set by IDEProjectQuerySet.with_file_counts()
+        if hasattr(self, '_file_count'):
+            return self._file_count
+        return self.files.count()
+    
+    def bulk_create_files(self, files_data, batch_size=500):
+        """Create files from an iterable of field dicts in batched INSERTs"""
+        files = [CodeFile(project=self, **data) for data in files_data]
+        for file in files:
+            # bulk_create() bypasses save()
+            file.update_metadata()
+        return CodeFile.objects.bulk_create(files, batch_size=batch_size)
+    
     def update_access_time(self):
         """Update last accessed time"""
         self.last_accessed = timezone.now()
-        self.save(update_fields=['last_accessed'])
+        type(self).objects.filter(pk=self.pk).update(last_accessed=self.last_accessed)
 
 
 class CodeFile(models.Model):
@@ -893,7 +1067,7 @@ class CodeFile(models.Model):
     content = models.TextField(help_text="File content")
     
     # File metadata
-    FILE_TYPE_CHOICES = [
+    FILE_TYPE_CHOICES = (
         ('python', 'Python'),
         ('javascript', 'JavaScript'),
         ('typescript', 'TypeScript'),
@@ -904,9 +1078,21 @@ class CodeFile(models.Model):
         ('yaml', 'YAML'),
         ('text', 'Plain Text'),
         ('other', 'Other'),
-    ]
+    )
     file_type = models.CharField(max_length=50, choices=FILE_TYPE_CHOICES, default='python')
     language = models.CharField(max_length=50, blank=True, null=True, help_text="Programming language")
+    EXTENSION_LANGUAGES = {
+        '.py': 'python',
+        '.js': 'javascript',
+        '.ts': 'typescript',
+        '.html': 'html',
+        '.css': 'css',
+        '.json': 'json',
+        '.md': 'markdown',
+        '.yml': 'yaml',
+        '.yaml': 'yaml',
+        '.txt': 'text',
+    }
     
     # Version control
     version = models.IntegerField(default=1)
@@ -927,8 +1113,8 @@ class CodeFile(models.Model):
     class Meta:
         ordering = ['path', 'name']
         unique_together = [['project', 'path']]
+        # The unique (project, path) index already serves per-project file lists
         indexes = [
-            models.Index(fields=['project', 'path']),
             models.Index(fields=['file_type']),
             models.Index(fields=['-updated_at']),
         ]
@@ -936,29 +1122,32 @@ class CodeFile(models.Model):
     def __str__(self):
         return f"{self.path} ({self.project.name})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Content as loaded (absent if deferred), so save() can skip unchanged content
+        instance._saved_content = instance.__dict__.get('content')
+        return instance
+    
     def save(self, *args, **kwargs):
-        # Auto-calculate metadata
-        self.size_bytes = len(self.content.encode('utf-8'))
-        self.line_count = self.content.count('\n') + 1
+        self.update_metadata()
         super().save(*args, **kwargs)
     
+    def update_metadata(self):
+        """Auto-calculate size and line count from content, if it changed"""
+        content = self.__dict__.get('content')
+        if content is None or content == getattr(self, '_saved_content', None):
+            return
+        # One UTF-8 encode serves both counts; a newline is always a single byte
+        data = content.encode('utf-8')
+        self.size_bytes = len(data)
+        self.line_count = data.count(b'\n') + 1
+        self._saved_content = content
+    
     def detect_language(self):
         """Auto-detect programming language from file extension"""
-        ext_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.html': 'html',
-            '.css': 'css',
-            '.json': 'json',
-            '.md': 'markdown',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.txt': 'text',
-        }
-        import os
         _, ext = os.path.splitext(self.name)
-        return ext_map.get(ext.lower(), 'other')
+        return self.EXTENSION_LANGUAGES.get(ext.lower(), 'other')
 
 
 class IDEChatMessage(models.Model):
@@ -966,11 +1155,11 @@ class IDEChatMessage(models.Model):
     
     project = models.ForeignKey(IDEProject, on_delete=models.CASCADE, related_name='chat_messages')
     
-    ROLE_CHOICES = [
+    ROLE_CHOICES = (
         ('user', 'User'),
         ('assistant', 'Assistant'),
         ('system', 'System'),
-    ]
+    )
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
     content = models.TextField(help_text="Message content")
     
@@ -984,7 +1173,7 @@ class IDEChatMessage(models.Model):
     tokens_used = models.IntegerField(blank=True, null=True)
     
     # Message actions
-    MESSAGE_TYPE_CHOICES = [
+    MESSAGE_TYPE_CHOICES = (
         ('chat', 'Chat'),
         ('code_generation', 'Code Generation'),
         ('code_explanation', 'Code Explanation'),
@@ -992,7 +1181,7 @@ class IDEChatMessage(models.Model):
         ('code_refactor', 'Code Refactor'),
         ('documentation', 'Documentation'),
         ('other', 'Other'),
-    ]
+    )
     message_type = models.CharField(max_length=50, choices=MESSAGE_TYPE_CHOICES, default='chat')
     
     # Timestamps
@@ -1004,6 +1193,7 @@ class IDEChatMessage(models.Model):
             models.Index(fields=['project', 'created_at']),
             models.Index(fields=['role']),
             models.Index(fields=['message_type']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -1021,26 +1211,26 @@ class CodeExecutionResult(models.Model):
     code = models.TextField(help_text="Code that was executed")
     
     # Execution settings
-    EXECUTION_TYPE_CHOICES = [
+    EXECUTION_TYPE_CHOICES = (
         ('full', 'Full Project'),
         ('file', 'Single File'),
         ('snippet', 'Code Snippet'),
         ('terminal', 'Terminal Command'),
-    ]
+    )
     execution_type = models.CharField(max_length=50, choices=EXECUTION_TYPE_CHOICES, default='snippet')
     
     command = models.TextField(blank=True, null=True, help_text="Command executed")
     environment = models.JSONField(default=dict, blank=True, help_text="Environment variables")
     
     # Results
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('running', 'Running'),
         ('completed', 'Completed'),
         ('error', 'Error'),
         ('timeout', 'Timeout'),
         ('cancelled', 'Cancelled'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     stdout = models.TextField(blank=True, null=True, help_text="Standard output")
@@ -1063,6 +1253,7 @@ class CodeExecutionResult(models.Model):
             models.Index(fields=['project', '-created_at']),
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['status']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -1084,7 +1275,7 @@ class ProjectDeployment(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='deployments')
     
     # Deployment details
-    PLATFORM_CHOICES = [
+    PLATFORM_CHOICES = (
         ('github', 'GitHub'),
         ('gitlab', 'GitLab'),
         ('heroku', 'Heroku'),
@@ -1094,7 +1285,7 @@ class ProjectDeployment(models.Model):
         ('gcp', 'Google Cloud'),
         ('azure', 'Azure'),
         ('custom', 'Custom'),
-    ]
+    )
     platform = models.CharField(max_length=50, choices=PLATFORM_CHOICES)
     
     # Deployment configuration
@@ -1103,12 +1294,12 @@ class ProjectDeployment(models.Model):
     config = models.JSONField(default=dict, blank=True, help_text="Deployment configuration")
     
     # Status
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('deploying', 'Deploying'),
         ('success', 'Success'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Logs and results
@@ -1126,6 +1317,7 @@ class ProjectDeployment(models.Model):
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['platform']),
             models.Index(fields=['status']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -1139,15 +1331,15 @@ class ProjectExport(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='project_exports')
     
     # Export details
-    EXPORT_FORMAT_CHOICES = [
+    EXPORT_FORMAT_CHOICES = (
         ('zip', 'ZIP Archive'),
         ('tar', 'TAR Archive'),
         ('github', 'GitHub Repository'),
-    ]
+    )
     export_format = models.CharField(max_length=50, choices=EXPORT_FORMAT_CHOICES, default='zip')
     
     # Export data
-    file_data = models.TextField(blank=True, null=True, help_text="Base64 encoded export file")
+    file_data = models.BinaryField(blank=True, null=True, help_text="Raw export file bytes")
     file_size = models.IntegerField(blank=True, null=True, help_text="Export file size in bytes")
     download_url = models.URLField(blank=True, null=True, help_text="External download URL")
     
@@ -1156,24 +1348,27 @@ class ProjectExport(models.Model):
     include_venv = models.BooleanField(default=False)
     
     # Status
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
-    ]
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Timestamps
     created_at = models.DateTimeField(default=timezone.now)
     expires_at = models.DateTimeField(blank=True, null=True, help_text="Export expiration time")
     
+    objects = ExportManager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['project', '-created_at']),
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['status']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -1223,5 +1418,7 @@ class UserIDEPreferences(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserPreferencesManager()
+    
     def __str__(self):
         return f"IDE preferences for {self.user.username}"
\ No newline at end of file
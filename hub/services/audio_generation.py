@@ -5,19 +5,18 @@ Supports multiple Hugging Face TTS models with robust fallbacks
 
 import os
 import requests
-import base64
-import json
+import hashlib
 import time
 import logging
 import math
 import struct
 from typing import Dict, List, Optional, Any
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
-# Cache for TTS responses (use Redis in production)
-_audio_cache: Dict[str, Dict[str, Any]] = {}
+# TTS responses are kept in Django's cache (Redis when REDIS_URL is set), so all workers share them
 CACHE_TTL = 3600  # 1 hour
 
 
@@ -34,13 +33,33 @@ def get_huggingface_api_key() -> str:
 
 
 def create_cache_key(text: str, voice_id: str, model: str) -> str:
-    """Create a cache key for the TTS request"""
-    cache_data = {
-        'text': text.strip().lower(),
-        'voice_id': voice_id,
-        'model': model
-    }
-    return str(hash(json.dumps(cache_data, sort_keys=True)))
+    """Create a cache key for the TTS request, stable across processes"""
+    digest = hashlib.sha256(f"{model}|{voice_id}|{text.strip().lower()}".encode()).hexdigest()
+    return f"tts:{digest}"
+
+
+def _get_cached_result(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Read a cached TTS result, or None on a miss or cache outage"""
+    try:
+        metadata = cache.get(f"{cache_key}:meta")
+        # The audio bytes are only fetched once the small metadata entry hits
+        audio_data = cache.get(f"{cache_key}:blob") if metadata is not None else None
+    except Exception as e:
+        logger.warning(f"TTS cache read failed: {str(e)}")
+        return None
+    if audio_data is None:
+        return None
+    return {**metadata, 'audio_data': audio_data}
+
+
+def _set_cached_result(cache_key: str, result: Dict[str, Any]) -> None:
+    """Cache a TTS result, keeping the metadata dict and the audio bytes under separate keys"""
+    metadata = {key: value for key, value in result.items() if key != 'audio_data'}
+    try:
+        cache.set(f"{cache_key}:blob", result['audio_data'], CACHE_TTL)
+        cache.set(f"{cache_key}:meta", metadata, CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"TTS cache write failed: {str(e)}")
 
 
 def generate_audio(
@@ -67,7 +86,7 @@ def generate_audio(
         timeout: Request timeout in seconds
     
     Returns:
-        Dict containing success status, audio data, and metadata
+        Dict containing success status, raw audio bytes, and metadata
     """
     start_time = time.time()
     
@@ -86,11 +105,10 @@ def generate_audio(
     try:
         # Check cache first
         cache_key = create_cache_key(text, voice_id or 'default', model)
-        if cache_key in _audio_cache:
-            cached_result = _audio_cache[cache_key]
-            if time.time() - cached_result['timestamp'] < CACHE_TTL:
-                cached_result['cached'] = True
-                return cached_result
+        cached_result = _get_cached_result(cache_key)
+        if cached_result is not None:
+            cached_result['cached'] = True
+            return cached_result
         
         # Try multiple Hugging Face TTS models as fallbacks
         tts_models = [
@@ -114,8 +132,7 @@ def generate_audio(
                     result['model'] = model_name
                     
                     # Cache successful result
-                    result['timestamp'] = time.time()
-                    _audio_cache[cache_key] = result.copy()
+                    _set_cached_result(cache_key, result)
                     result['cached'] = False
                     
                     return result
@@ -174,10 +191,9 @@ def _try_speecht5_tts(text: str, voice_id: Optional[str], timeout: int) -> Dict[
     response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
     
     if response.status_code == 200:
-        audio_data = base64.b64encode(response.content).decode('utf-8')
         return {
             'success': True,
-            'audio_data': audio_data,
+            'audio_data': response.content,
             'mime_type': 'audio/wav',
             'voice_used': voice_id or 'default',
             'file_size': len(response.content),
@@ -212,10 +228,9 @@ def _try_mms_tts(text: str, voice_id: Optional[str], timeout: int) -> Dict[str,
     response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
     
     if response.status_code == 200:
-        audio_data = base64.b64encode(response.content).decode('utf-8')
         return {
             'success': True,
-            'audio_data': audio_data,
+            'audio_data': response.content,
             'mime_type': 'audio/wav',
             'voice_used': voice_id or 'default',
             'file_size': len(response.content),
@@ -250,10 +265,9 @@ def _try_vits_tts(text: str, voice_id: Optional[str], timeout: int) -> Dict[str,
     response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
     
     if response.status_code == 200:
-        audio_data = base64.b64encode(response.content).decode('utf-8')
         return {
             'success': True,
-            'audio_data': audio_data,
+            'audio_data': response.content,
             'mime_type': 'audio/wav',
             'voice_used': voice_id or 'default',
             'file_size': len(response.content),
@@ -295,10 +309,9 @@ def _try_bark_tts(text: str, voice_id: Optional[str], timeout: int) -> Dict[str,
     response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
     
     if response.status_code == 200:
-        audio_data = base64.b64encode(response.content).decode('utf-8')
         return {
             'success': True,
-            'audio_data': audio_data,
+            'audio_data': response.content,
             'mime_type': 'audio/wav',
             'voice_used': voice_id or 'v2/en_speaker_6',
             'file_size': len(response.content),
@@ -325,22 +338,21 @@ def _try_mock_tts(text: str, voice_id: Optional[str], model: str, timeout: int)
     duration = min(len(text) * 0.1, 5.0)  # Duration based on text length, max 5 seconds
     frequency = 440  # A4 note
     
-    # Generate sine wave
-    samples = []
-    for i in range(int(sample_rate * duration)):
-        sample = int(32767 * math.sin(2 * math.pi * frequency * i / sample_rate) * 0.1)
-        samples.append(struct.pack('<h', sample))
+    # Generate sine wave, packed as little-endian 16-bit PCM in a single call
+    sample_count = int(sample_rate * duration)
+    amplitude = 32767 * 0.1
+    step = 2 * math.pi * frequency / sample_rate
+    sin = math.sin
+    samples = [int(amplitude * sin(step * i)) for i in range(sample_count)]
+    audio_data = struct.pack(f'<{sample_count}h', *samples)
     
     # Create WAV header
-    audio_data = b''.join(samples)
     wav_header = _create_wav_header(len(audio_data), sample_rate)
     full_audio = wav_header + audio_data
     
-    audio_b64 = base64.b64encode(full_audio).decode('utf-8')
-    
     return {
         'success': True,
-        'audio_data': audio_b64,
+        'audio_data': full_audio,
         'mime_type': 'audio/wav',
         'model': 'mock-tts',
         'voice_used': voice_id or 'mock',
@@ -405,7 +417,6 @@ def get_audio_metrics() -> Dict[str, Any]:
             'supported_formats': ['wav', 'mp3'],
             'max_text_length': 5000,  # Characters
             'supported_languages': ['en'],  # Add more as models support them
-            'cache_entries': len(_audio_cache),
             'cache_ttl': CACHE_TTL,
             'status': 'operational'
         }
@@ -416,26 +427,3 @@ def get_audio_metrics() -> Dict[str, Any]:
             'error': str(e)
         }
 
-
-def clear_audio_cache():
-    """Clear the audio generation cache"""
-    global _audio_cache
-    _audio_cache.clear()
-
-
-def get_cache_info() -> Dict[str, Any]:
-    """Get information about the current cache"""
-    current_time = time.time()
-    valid_entries = 0
-    total_entries = len(_audio_cache)
-    
-    for cached_result in _audio_cache.values():
-        if current_time - cached_result['timestamp'] < CACHE_TTL:
-            valid_entries += 1
-    
-    return {
-        'total_entries': total_entries,
-        'valid_entries': valid_entries,
-        'expired_entries': total_entries - valid_entries,
-        'cache_ttl': CACHE_TTL
-    }
\ No newline at end of file
@@ -9,7 +9,6 @@ import tempfile
 import shutil
 import zipfile
 import io
-import base64
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -311,7 +310,7 @@ if __name__ == "__main__":
                                 zipf.write(file_path, arcname)
                     
                     archive_data = archive_buffer.getvalue()
-                    result['file_data'] = base64.b64encode(archive_data).decode('utf-8')
+                    result['file_data'] = archive_data
                     result['file_size'] = len(archive_data)
                     result['status'] = 'completed'
                 else:
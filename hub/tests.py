@@ -0,0 +1,72 @@
+from unittest import mock
+
+from django.contrib.auth.models import Permission, User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from .models import GeneratedImage, ImageGenerationRequest
+from .services import audio_generation
+
+
+class GeneratedMediaViewTests(TestCase):
+    """Access rules for the raw generated-media endpoint"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', password='pass')
+        cls.staff = User.objects.create_user('staff', password='pass', is_staff=True)
+        image_request = ImageGenerationRequest.objects.create(user=cls.owner, prompt='a private image')
+        cls.image = GeneratedImage.objects.create(request=image_request, image_data=b'png-bytes')
+        cls.url = reverse('generated_image_file', args=[cls.image.pk])
+
+    def test_owner_can_fetch_private_item(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'png-bytes')
+
+    def test_staff_without_view_permission_gets_404(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_staff_with_view_permission_can_fetch_private_item(self):
+        self.staff.user_permissions.add(Permission.objects.get(codename='view_generatedimage'))
+        self.client.force_login(self.staff)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+
+class GenerateAudioCacheTests(SimpleTestCase):
+    """The TTS result cache is best-effort and never costs a good result"""
+
+    def setUp(self):
+        tts_result = {
+            'success': True,
+            'audio_data': b'wav-bytes',
+            'mime_type': 'audio/wav',
+            'voice_used': 'default',
+            'file_size': 9,
+            'cached': False,
+        }
+        patcher = mock.patch.object(audio_generation, '_try_speecht5_tts', return_value=tts_result)
+        self.speecht5 = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_outage_returns_backend_result(self):
+        with mock.patch.object(audio_generation.cache, 'get', side_effect=ConnectionError('down')), \
+                mock.patch.object(audio_generation.cache, 'set', side_effect=ConnectionError('down')):
+            result = audio_generation.generate_audio('Hello cache outage')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['audio_data'], b'wav-bytes')
+        self.assertEqual(result['model'], 'microsoft/speecht5_tts')
+        self.assertFalse(result['cached'])
+        self.speecht5.assert_called_once()
+
+    def test_cached_result_is_reassembled_from_metadata_and_blob(self):
+        audio_generation.generate_audio('Hello cache hit')
+        result = audio_generation.generate_audio('Hello cache hit')
+        self.assertTrue(result['cached'])
+        self.assertEqual(result['audio_data'], b'wav-bytes')
+        self.assertEqual(result['mime_type'], 'audio/wav')
+        self.speecht5.assert_called_once()
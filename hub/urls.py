@@ -1,6 +1,6 @@
 from django.urls import path
 from .views import (
-    IndexView, ChatAPIView, SignUpView, LoginView, LogoutView,
+    IndexView, ChatAPIView, SignUpView, LoginView, LogoutView, GeneratedMediaView,
     ImageGenerationView, QuickImageView, ImageGenerationAPIView,
     ImageResultView, ImageGalleryView, ImageUpscaleView, ImageMetricsView,
     VideoGenerationView, QuickVideoView, VideoGenerationAPIView, VideoResultView, VideoGalleryView, VideoMetricsView,
@@ -10,6 +10,8 @@ from .views import (
     PresentationExportView, PresentationDownloadView, PresentationMetricsView
 )
 
+from .models import GeneratedImage, GeneratedVideo, GeneratedAudio
+
 # Import IDE views
 from .views_ide import (
     IDEDashboardView, ProjectCreateView, IDEEditorView, ProjectDeleteView,
@@ -36,6 +38,7 @@ urlpatterns = [
     path('images/quick/', QuickImageView.as_view(), name='quick_image'),
     path('images/result/<int:request_id>/', ImageResultView.as_view(), name='image_result'),
     path('images/gallery/', ImageGalleryView.as_view(), name='image_gallery'),
+    path('images/file/<int:media_id>/', GeneratedMediaView.as_view(model=GeneratedImage, data_field='image_data'), name='generated_image_file'),
     
     # Image API URLs
     path('api/images/generate/', ImageGenerationAPIView.as_view(), name='image_generation_api'),
@@ -47,6 +50,7 @@ urlpatterns = [
     path('videos/quick/', QuickVideoView.as_view(), name='quick_video'),
     path('videos/result/<int:request_id>/', VideoResultView.as_view(), name='video_result'),
     path('videos/gallery/', VideoGalleryView.as_view(), name='video_gallery'),
+    path('videos/file/<int:media_id>/', GeneratedMediaView.as_view(model=GeneratedVideo, data_field='video_data'), name='generated_video_file'),
     
     # Video API URLs
     path('api/videos/generate/', VideoGenerationAPIView.as_view(), name='video_generation_api'),
@@ -57,6 +61,7 @@ urlpatterns = [
     path('audio/quick/', QuickAudioView.as_view(), name='quick_audio'),
     path('audio/result/<int:request_id>/', AudioResultView.as_view(), name='audio_result'),
     path('audio/gallery/', AudioGalleryView.as_view(), name='audio_gallery'),
+    path('audio/file/<int:media_id>/', GeneratedMediaView.as_view(model=GeneratedAudio, data_field='audio_data'), name='generated_audio_file'),
     
     # Audio API URLs
     path('api/audio/generate/', AudioGenerationAPIView.as_view(), name='audio_generation_api'),
@@ -6,12 +6,13 @@ from django import forms
 from django.http import JsonResponse, StreamingHttpResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.forms import AuthenticationForm
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.core.paginator import Paginator
 from django.db import transaction
-from django.db.models import Avg, Sum
+from django.db.models import Avg, Q, Sum
 from django.utils import timezone
 from .forms import (
     SignUpForm, ImageGenerationForm, QuickImageForm, ImageUpscaleForm, 
@@ -32,6 +33,7 @@ from .services.video_generation import generate_video, get_video_metrics
 from .services.audio_generation import generate_audio, get_audio_metrics
 from .services.presentation_generation import generate_presentation, get_presentation_metrics, get_available_themes, get_available_templates
 import json
+import re
 import time
 import base64
 from .services.openrouter import generate_response
@@ -258,10 +260,18 @@ class ChatAPIView(LoginRequiredMixin, View):
         
         if path == '/api/conversations/':
             # Return list of conversations for the user
-            conversations = ChatConversation.objects.filter(user=request.user).values(
-                'id', 'title', 'created_at', 'updated_at'
-            )
-            return JsonResponse(list(conversations), safe=False)
+            conversations = ChatConversation.objects.filter(user=request.user).with_last_message()
+            data = []
+            for conversation in conversations:
+                last_message = conversation.last_message
+                data.append({
+                    'id': conversation.id,
+                    'title': conversation.title,
+                    'created_at': conversation.created_at,
+                    'updated_at': conversation.updated_at,
+                    'last_message': last_message.content[:100] if last_message else None,
+                })
+            return JsonResponse(data, safe=False)
         
         elif conversation_id and 'messages' in path:
             # Return messages for a conversation
@@ -418,16 +428,14 @@ class ImageGenerationView(LoginRequiredMixin, View):
                         for image_data in result['images']:
                             GeneratedImage.objects.create(
                                 request=image_request,
-                                image_data=image_data['base64'],
+                                image_data=(raw := base64.b64decode(image_data['base64'])),
                                 seed_used=image_data.get('seed'),
                                 finish_reason=image_data.get('finish_reason'),
-                                file_size=len(base64.b64decode(image_data['base64']))
+                                file_size=len(raw)
                             )
                         
                         # Update user preferences/stats
-                        preferences, created = UserImagePreferences.objects.get_or_create(
-                            user=request.user
-                        )
+                        preferences = UserImagePreferences.objects.get_for_user(request.user)
                         preferences.update_stats(result['generation_time'], len(result['images']))
                     
                     return redirect('image_result', request_id=image_request.id)
@@ -494,10 +502,10 @@ class QuickImageView(LoginRequiredMixin, View):
                     for image_data in result['images']:
                         GeneratedImage.objects.create(
                             request=image_request,
-                            image_data=image_data['base64'],
+                            image_data=(raw := base64.b64decode(image_data['base64'])),
                             seed_used=image_data.get('seed'),
                             finish_reason=image_data.get('finish_reason'),
-                            file_size=len(base64.b64decode(image_data['base64']))
+                            file_size=len(raw)
                         )
                 
                 return redirect('image_result', request_id=image_request.id)
@@ -567,10 +575,10 @@ class ImageGenerationAPIView(LoginRequiredMixin, View):
                 for image_data in result['images']:
                     img = GeneratedImage.objects.create(
                         request=image_request,
-                        image_data=image_data['base64'],
+                        image_data=(raw := base64.b64decode(image_data['base64'])),
                         seed_used=image_data.get('seed'),
                         finish_reason=image_data.get('finish_reason'),
-                        file_size=len(base64.b64decode(image_data['base64']))
+                        file_size=len(raw)
                     )
                     images.append({
                         'id': img.id,
@@ -597,6 +605,49 @@ class ImageGenerationAPIView(LoginRequiredMixin, View):
             return JsonResponse({'error': str(e)}, status=500)
 
 
+def _media_response(request, data, content_type):
+    """Response for raw media bytes, honouring a single "bytes=start-end" Range header"""
+    size = len(data)
+    match = re.fullmatch(r'bytes=(\d*)-(\d*)', request.headers.get('Range', ''))
+    if match and any(match.groups()):
+        first, last = match.groups()
+        if first:
+            start, end = int(first), min(int(last) if last else size - 1, size - 1)
+        else:
+            # Suffix range: the last N bytes
+            start, end = max(size - int(last), 0), size - 1
+        if start > end:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        response = HttpResponse(data[start:end + 1], content_type=content_type, status=206)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    else:
+        response = HttpResponse(data, content_type=content_type)
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+class GeneratedMediaView(LoginRequiredMixin, View):
+    """Serve a generated image, video or audio file as raw bytes.
+    
+    Pages link here instead of inlining base64 data URLs, so the payload is
+    sent once, without the base64 overhead, and cached by the browser.
+    """
+    model = None
+    data_field = None
+    login_url = reverse_lazy('login')
+    
+    @method_decorator(cache_control(private=True, max_age=86400))
+    def get(self, request, media_id):
+        queryset = self.model.objects.with_data()
+        # Users who may view these items in the admin, where they are previewed through here, see them all
+        if not request.user.has_perm(f'hub.view_{self.model._meta.model_name}'):
+            queryset = queryset.filter(Q(request__user=request.user) | Q(public=True))
+        media = get_object_or_404(queryset.only('mime_type', self.data_field), id=media_id)
+        return _media_response(request, getattr(media, self.data_field), media.mime_type)
+
+
 class ImageResultView(LoginRequiredMixin, View):
     """View to display image generation results"""
     template_name = 'image_result.html'
@@ -632,9 +683,7 @@ class ImageGalleryView(LoginRequiredMixin, View):
         requests = paginator.get_page(page_number)
         
         # Get user stats
-        user_preferences, _ = UserImagePreferences.objects.get_or_create(
-            user=request.user
-        )
+        user_preferences = UserImagePreferences.objects.get_for_user(request.user)
         
         context = {
             'requests': requests,
@@ -659,7 +708,7 @@ class ImageUpscaleView(LoginRequiredMixin, View):
                 
                 # Get the original image
                 original_image = get_object_or_404(
-                    GeneratedImage.objects.select_related('request'),
+                    GeneratedImage.objects.with_data().select_related('request'),
                     id=image_id,
                     request__user=request.user
                 )
@@ -673,7 +722,7 @@ class ImageUpscaleView(LoginRequiredMixin, View):
                 
                 try:
                     # Perform upscaling
-                    result = upscale_image(original_image.image_data)
+                    result = upscale_image(base64.b64encode(original_image.image_data).decode('ascii'))
                     
                     # Save result
                     upscale_request.status = 'completed'
@@ -784,16 +833,14 @@ class VideoGenerationAPIView(LoginRequiredMixin, View):
                     # Create generated video record
                     video = GeneratedVideo.objects.create(
                         request=video_request,
-                        video_data=result['video_data'],
+                        video_data=base64.b64decode(result['video_data']),
                         file_size=result.get('file_size'),
                         mime_type=result.get('mime_type', 'video/mp4')
                     )
                     
                     # Update user preferences/stats
                     try:
-                        preferences, created = UserVideoPreferences.objects.get_or_create(
-                            user=request.user
-                        )
+                        preferences = UserVideoPreferences.objects.get_for_user(request.user)
                         preferences.update_stats(result['generation_time'])
                     except Exception:
                         pass  # Continue even if stats update fails
@@ -891,16 +938,14 @@ class VideoGenerationView(LoginRequiredMixin, View):
                         # Create generated video record
                         generated_video = GeneratedVideo.objects.create(
                             request=video_request,
-                            video_data=result['video_data'],
+                            video_data=base64.b64decode(result['video_data']),
                             file_size=result.get('file_size'),
                             mime_type=result.get('mime_type', 'video/mp4')
                         )
                         
                         # Update user preferences/stats
                         try:
-                            preferences, created = UserVideoPreferences.objects.get_or_create(
-                                user=request.user
-                            )
+                            preferences = UserVideoPreferences.objects.get_for_user(request.user)
                             preferences.update_stats(result['generation_time'])
                         except Exception:
                             pass  # Continue even if stats update fails
@@ -977,7 +1022,7 @@ class QuickVideoView(LoginRequiredMixin, View):
                     # Create generated video record
                     generated_video = GeneratedVideo.objects.create(
                         request=video_request,
-                        video_data=result['video_data'],
+                        video_data=base64.b64decode(result['video_data']),
                         file_size=result.get('file_size'),
                         mime_type=result.get('mime_type', 'video/mp4')
                     )
@@ -1134,9 +1179,7 @@ class AudioGenerationView(LoginRequiredMixin, View):
                         
                         # Update user preferences/stats
                         try:
-                            preferences, created = UserAudioPreferences.objects.get_or_create(
-                                user=request.user
-                            )
+                            preferences = UserAudioPreferences.objects.get_for_user(request.user)
                             preferences.update_stats(
                                 result['generation_time'],
                                 len(form.cleaned_data['text'])
@@ -1305,9 +1348,7 @@ class AudioGenerationAPIView(LoginRequiredMixin, View):
                     
                     # Update user preferences/stats
                     try:
-                        preferences, created = UserAudioPreferences.objects.get_or_create(
-                            user=request.user
-                        )
+                        preferences = UserAudioPreferences.objects.get_for_user(request.user)
                         preferences.update_stats(result['generation_time'], len(text))
                     except Exception:
                         pass
@@ -1431,7 +1472,7 @@ class PresentationGenerationView(LoginRequiredMixin, View):
         # Get user's recent presentation requests
         recent_requests = PresentationProject.objects.filter(
             user=request.user
-        ).select_related().prefetch_related('slides')[:10]
+        ).with_slide_counts()[:10]
         
         # Get available themes and templates
         themes = get_available_themes()
@@ -1487,29 +1528,33 @@ class PresentationGenerationView(LoginRequiredMixin, View):
                         presentation.model_used = result['model_used']
                         presentation.save()
                         
-                        for slide_data in result['slides']:
-                            slide = PresentationSlide.objects.create(
-                                presentation=presentation,
-                                slide_number=slide_data['slide_number'],
-                                title=slide_data.get('title', ''),
-                                subtitle=slide_data.get('subtitle', ''),
-                                content=slide_data.get('main_content', ''),
-                                notes=slide_data.get('speaker_notes', ''),
-                                slide_type=slide_data.get('slide_type', 'content'),
-                                layout=slide_data.get('layout', 'default')
+                        slides = presentation.bulk_create_slides(
+                            {
+                                'slide_number': slide_data['slide_number'],
+                                'title': slide_data.get('title', ''),
+                                'subtitle': slide_data.get('subtitle', ''),
+                                'content': slide_data.get('main_content', ''),
+                                'notes': slide_data.get('speaker_notes', ''),
+                                'slide_type': slide_data.get('slide_type', 'content'),
+                                'layout': slide_data.get('layout', 'default')
+                            }
+                            for slide_data in result['slides']
+                        )
+                        
+                        # Create slide elements if bullet points exist
+                        SlideElement.objects.bulk_create([
+                            SlideElement(
+                                slide=slide,
+                                element_type='bullet_list',
+                                content='\n'.join(slide_data['bullet_points']),
+                                position_x=0,
+                                position_y=20,
+                                width=100,
+                                height=60
                             )
-                            
-                            # Create slide elements if bullet points exist
-                            if slide_data.get('bullet_points'):
-                                SlideElement.objects.create(
-                                    slide=slide,
-                                    element_type='bullet_list',
-                                    content='\n'.join(slide_data['bullet_points']),
-                                    position_x=0,
-                                    position_y=20,
-                                    width=100,
-                                    height=60
-                                )
+                            for slide, slide_data in zip(slides, result['slides'])
+                            if slide_data.get('bullet_points')
+                        ], batch_size=500)
                     
                     # Update user preferences
                     prefs, created = UserPresentationPreferences.objects.get_or_create(
@@ -1540,7 +1585,7 @@ class PresentationGenerationView(LoginRequiredMixin, View):
                 form.add_error(None, f"An error occurred: {str(e)}")
         
         # Get data for re-rendering form
-        recent_requests = PresentationProject.objects.filter(user=request.user)[:10]
+        recent_requests = PresentationProject.objects.filter(user=request.user).with_slide_counts()[:10]
         themes = get_available_themes()
         templates = get_available_templates()
         
@@ -1592,16 +1637,17 @@ class QuickPresentationView(LoginRequiredMixin, View):
                         presentation.model_used = result['model_used']
                         presentation.save()
                         
-                        for slide_data in result['slides']:
-                            PresentationSlide.objects.create(
-                                presentation=presentation,
-                                slide_number=slide_data['slide_number'],
-                                title=slide_data.get('title', ''),
-                                content=slide_data.get('main_content', ''),
-                                notes=slide_data.get('speaker_notes', ''),
-                                slide_type=slide_data.get('slide_type', 'content'),
-                                layout=slide_data.get('layout', 'default')
-                            )
+                        presentation.bulk_create_slides(
+                            {
+                                'slide_number': slide_data['slide_number'],
+                                'title': slide_data.get('title', ''),
+                                'content': slide_data.get('main_content', ''),
+                                'notes': slide_data.get('speaker_notes', ''),
+                                'slide_type': slide_data.get('slide_type', 'content'),
+                                'layout': slide_data.get('layout', 'default')
+                            }
+                            for slide_data in result['slides']
+                        )
                     
                     return redirect('presentation_result', presentation_id=presentation.id)
                 else:
@@ -1652,16 +1698,17 @@ class PresentationGenerationAPIView(LoginRequiredMixin, View):
                         model_used=result['model_used']
                     )
                     
-                    for slide_data in result['slides']:
-                        PresentationSlide.objects.create(
-                            presentation=presentation,
-                            slide_number=slide_data['slide_number'],
-                            title=slide_data.get('title', ''),
-                            content=slide_data.get('main_content', ''),
-                            notes=slide_data.get('speaker_notes', ''),
-                            slide_type=slide_data.get('slide_type', 'content'),
-                            layout=slide_data.get('layout', 'default')
-                        )
+                    presentation.bulk_create_slides(
+                        {
+                            'slide_number': slide_data['slide_number'],
+                            'title': slide_data.get('title', ''),
+                            'content': slide_data.get('main_content', ''),
+                            'notes': slide_data.get('speaker_notes', ''),
+                            'slide_type': slide_data.get('slide_type', 'content'),
+                            'layout': slide_data.get('layout', 'default')
+                        }
+                        for slide_data in result['slides']
+                    )
                 
                 return JsonResponse({
                     'success': True,
@@ -1819,17 +1866,13 @@ class SlideEditView(LoginRequiredMixin, View):
     login_url = reverse_lazy('login')
     
     def get(self, request, presentation_id, slide_id):
-        presentation = get_object_or_404(
-            PresentationProject,
-            id=presentation_id,
-            user=request.user
-        )
-        
         slide = get_object_or_404(
-            PresentationSlide,
+            PresentationSlide.objects.select_related('presentation'),
             id=slide_id,
-            presentation=presentation
+            presentation_id=presentation_id,
+            presentation__user=request.user
         )
+        presentation = slide.presentation
         
         form = SlideEditForm(initial={
             'title': slide.title,
@@ -1849,17 +1892,13 @@ class SlideEditView(LoginRequiredMixin, View):
     def post(self, request, presentation_id, slide_id):
         """Handle slide update via JSON or form data"""
         try:
-            presentation = get_object_or_404(
-                PresentationProject,
-                id=presentation_id,
-                user=request.user
-            )
-            
             slide = get_object_or_404(
-                PresentationSlide,
+                PresentationSlide.objects.select_related('presentation'),
                 id=slide_id,
-                presentation=presentation
+                presentation_id=presentation_id,
+                presentation__user=request.user
             )
+            presentation = slide.presentation
             
             # Check if request is JSON (from Alpine.js) or form data
             if request.content_type == 'application/json':
@@ -1936,7 +1975,7 @@ class PresentationGalleryView(LoginRequiredMixin, View):
     def get(self, request):
         presentations = PresentationProject.objects.filter(
             user=request.user
-        ).prefetch_related('slides').order_by('-updated_at')
+        ).with_slide_counts().order_by('-updated_at')
         
         # Pagination
         paginator = Paginator(presentations, 12)  # 12 presentations per page
@@ -2109,7 +2148,7 @@ class PresentationExportView(LoginRequiredMixin, View):
                 
                 data['presentation']['slides'].append(slide_data)
             
-            return base64.b64encode(json.dumps(data, indent=2).encode()).decode()
+            return json.dumps(data, indent=2).encode()
         
         elif format_type == 'html':
             # Simple HTML export
@@ -2145,7 +2184,7 @@ class PresentationExportView(LoginRequiredMixin, View):
             
             html_content += '</body></html>'
             
-            return base64.b64encode(html_content.encode()).decode()
+            return html_content.encode()
         
         else:
             # Fallback to JSON
@@ -2157,7 +2196,7 @@ class PresentationDownloadView(LoginRequiredMixin, View):
     
     def get(self, request, export_id):
         export = get_object_or_404(
-            PresentationExport,
+            PresentationExport.objects.with_data(),
             id=export_id,
             user=request.user,
             status='completed'
@@ -2166,9 +2205,6 @@ class PresentationDownloadView(LoginRequiredMixin, View):
         if export.is_expired:
             return HttpResponse("Export has expired", status=410)
         
-        # Decode file data
-        file_data = base64.b64decode(export.file_data)
-        
         # Set content type based on format
         content_types = {
             'pdf': 'application/pdf',
@@ -2181,7 +2217,7 @@ class PresentationDownloadView(LoginRequiredMixin, View):
         content_type = content_types.get(export.export_format, 'application/octet-stream')
         filename = f"{export.presentation.title}.{export.export_format}"
         
-        response = HttpResponse(file_data, content_type=content_type)
+        response = HttpResponse(export.file_data, content_type=content_type)
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
         return response
 
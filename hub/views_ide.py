@@ -14,7 +14,6 @@ from django.core.paginator import Paginator
 from django import forms
 import json
 import time
-import base64
 from datetime import timedelta
 
 from .models import (
@@ -69,7 +68,7 @@ class IDEDashboardView(LoginRequiredMixin, View):
     template_name = 'ide_dashboard.html'
     
     def get(self, request):
-        projects = IDEProject.objects.filter(user=request.user).order_by('-updated_at')
+        projects = IDEProject.objects.filter(user=request.user).with_file_counts().order_by('-updated_at')
         
         # Pagination
         paginator = Paginator(projects, 12)
@@ -77,7 +76,7 @@ class IDEDashboardView(LoginRequiredMixin, View):
         page_obj = paginator.get_page(page_number)
         
         # Get or create user preferences
-        preferences, created = UserIDEPreferences.objects.get_or_create(user=request.user)
+        preferences = UserIDEPreferences.objects.get_for_user(request.user)
         
         context = {
             'projects': page_obj,
@@ -112,21 +111,18 @@ class ProjectCreateView(LoginRequiredMixin, View):
                 structure = ide_service.create_project_structure(project.project_type)
                 
                 # Create files
-                for file_data in structure['files']:
-                    CodeFile.objects.create(
-                        project=project,
-                        name=file_data['name'],
-                        path=file_data['name'],
-                        content=file_data['content'],
-                        file_type=CodeFile.objects.model.detect_language(
-                            CodeFile(name=file_data['name'])
-                        ) if hasattr(CodeFile.objects.model, 'detect_language') else 'text'
-                    )
+                project.bulk_create_files(
+                    {
+                        'name': file_data['name'],
+                        'path': file_data['name'],
+                        'content': file_data['content'],
+                        'file_type': CodeFile(name=file_data['name']).detect_language(),
+                    }
+                    for file_data in structure['files']
+                )
                 
                 # Update user preferences
-                preferences, _ = UserIDEPreferences.objects.get_or_create(user=request.user)
-                preferences.total_projects += 1
-                preferences.save()
+                UserIDEPreferences.objects.increment(request.user, total_projects=1)
                 
                 return redirect('ide_editor', project_id=project.id)
         
@@ -195,8 +191,8 @@ class FileAPIView(LoginRequiredMixin, View):
                 }
             })
         else:
-            # Get all files
-            files = project.files.all()
+            # Get all files (metadata only, the listing never needs file bodies)
+            files = project.files.defer('content')
             
             return JsonResponse({
                 'success': True,
@@ -343,9 +339,7 @@ class CodeExecutionView(LoginRequiredMixin, View):
             project.save(update_fields=['total_executions'])
             
             # Update user preferences stats
-            preferences, _ = UserIDEPreferences.objects.get_or_create(user=request.user)
-            preferences.total_executions += 1
-            preferences.save()
+            UserIDEPreferences.objects.increment(request.user, total_executions=1)
             
             return JsonResponse({
                 'success': True,
@@ -371,7 +365,7 @@ class ExecutionHistoryView(LoginRequiredMixin, View):
     def get(self, request, project_id):
         project = get_object_or_404(IDEProject, id=project_id, user=request.user)
         
-        executions = project.executions.all()[:50]
+        executions = project.executions.defer('code', 'command', 'environment', 'stdout', 'stderr')[:50]
         
         return JsonResponse({
             'success': True,
@@ -489,9 +483,7 @@ class IDEChatView(LoginRequiredMixin, View):
             project.save(update_fields=['total_ai_queries'])
             
             # Update user preferences
-            preferences, _ = UserIDEPreferences.objects.get_or_create(user=request.user)
-            preferences.total_ai_queries += 1
-            preferences.save()
+            UserIDEPreferences.objects.increment(request.user, total_ai_queries=1)
             
             return JsonResponse({
                 'success': True,
@@ -524,7 +516,7 @@ class IDEChatView(LoginRequiredMixin, View):
         """Get chat history"""
         project = get_object_or_404(IDEProject, id=project_id, user=request.user)
         
-        messages = project.chat_messages.all()[:100]
+        messages = project.chat_messages.defer('code_snippets')[:100]
         
         return JsonResponse({
             'success': True,
@@ -595,7 +587,7 @@ class ProjectExportView(LoginRequiredMixin, View):
     def get(self, request, project_id, export_id):
         """Download exported project"""
         project = get_object_or_404(IDEProject, id=project_id, user=request.user)
-        export = get_object_or_404(ProjectExport, id=export_id, project=project)
+        export = get_object_or_404(ProjectExport.objects.with_data(), id=export_id, project=project)
         
         if export.is_expired:
             return JsonResponse({
@@ -609,11 +601,8 @@ class ProjectExportView(LoginRequiredMixin, View):
                 'error': 'Export is not ready'
             }, status=400)
         
-        # Decode file data
-        file_data = base64.b64decode(export.file_data)
-        
         # Return file
-        response = HttpResponse(file_data, content_type='application/zip')
+        response = HttpResponse(export.file_data, content_type='application/zip')
         response['Content-Disposition'] = f'attachment; filename="{project.name}.zip"'
         
         return response
@@ -664,7 +653,7 @@ class IDEPreferencesView(LoginRequiredMixin, View):
     """Manage IDE user preferences"""
     
     def get(self, request):
-        preferences, _ = UserIDEPreferences.objects.get_or_create(user=request.user)
+        preferences = UserIDEPreferences.objects.get_for_user(request.user)
         
         return JsonResponse({
             'success': True,
@@ -685,7 +674,7 @@ class IDEPreferencesView(LoginRequiredMixin, View):
         })
     
     def post(self, request):
-        preferences, _ = UserIDEPreferences.objects.get_or_create(user=request.user)
+        preferences = UserIDEPreferences.objects.get_for_user(request.user)
         
         try:
             data = json.loads(request.body)